@@ -2,59 +2,100 @@
 
 __version__ = "0.0.1"
 
+import importlib
+
 from .map_object import MapObject
-from .hillshading import hillshade, multishade, smooth_hillshade, smooth_multishade
-from .fig2d import Fig2DObject, quickmap
-from .fig3d import quickmap3d, Fig3DObject
-from .processing import (
-    ProcessorFactory,
-    ProcessingFunction,
-    expand_plottables,
-    is_plottable,
-    processor,
-)
-from .helper3d import (
-    scale,
-    double_scale,
-    halve_scale,
-    tenfold,
-    tenthfold,
-    lighting_control,
-    matte_lighting,
-    glossy_lighting,
-    flat_lighting,
-    dramatic_lighting,
-    heightmap_lighting,
-    lighting_intensity_up,
-    lighting_intensity_down,
-    lighting_brighten,
-    lighting_darken,
-    light_rotate_left,
-    light_rotate_right,
-    light_raise,
-    light_lower,
-    BUILTIN_3D,
-)
-from .masknan import nan_above, nan_below, nan_equal, nan_mask, BUILTIN_MASK_NAN
-from .shading2d import hillshade_processor, multishade_processor, BUILTIN_SHADING
-from .filter2d import gaussian_smooth, BUILTIN_FILTERS
-from .style2d import (
-    apply_dark_pres_mono_style,
-    apply_color_pres_style,
-    apply_paper_style,
-    apply_bw_paper_style,
-    apply_nothing_style,
-    set_style,
-    get_style,
-)
-from .helper2d import convert_ticks_to_km, add_grid_crosses, add_colorbar
-from .helper2d_text import set_font, set_font_size, set_font_style, set_font_color
+from .style2d import set_style
+
+# Everything else is resolved on first attribute access (PEP 562) so that
+# ``import pytopoviz`` does not pull in PyVista/VTK, Numba or SciPy up front.
+_LAZY = {
+    "hillshade": "hillshading",
+    "multishade": "hillshading",
+    "smooth_hillshade": "hillshading",
+    "smooth_multishade": "hillshading",
+    "Fig2DObject": "fig2d",
+    "quickmap": "fig2d",
+    "Fig3DObject": "fig3d",
+    "quickmap3d": "fig3d",
+    "ProcessorFactory": "processing",
+    "ProcessingFunction": "processing",
+    "expand_plottables": "processing",
+    "expand_plottables_many": "processing",
+    "is_plottable": "processing",
+    "processor": "processing",
+    "scale": "helper3d",
+    "double_scale": "helper3d",
+    "halve_scale": "helper3d",
+    "tenfold": "helper3d",
+    "tenthfold": "helper3d",
+    "lighting_control": "helper3d",
+    "matte_lighting": "helper3d",
+    "glossy_lighting": "helper3d",
+    "flat_lighting": "helper3d",
+    "dramatic_lighting": "helper3d",
+    "heightmap_lighting": "helper3d",
+    "lighting_intensity_up": "helper3d",
+    "lighting_intensity_down": "helper3d",
+    "lighting_brighten": "helper3d",
+    "lighting_darken": "helper3d",
+    "light_rotate_left": "helper3d",
+    "light_rotate_right": "helper3d",
+    "light_raise": "helper3d",
+    "light_lower": "helper3d",
+    "BUILTIN_3D": "helper3d",
+    "nan_above": "masknan",
+    "nan_below": "masknan",
+    "nan_equal": "masknan",
+    "nan_filter": "masknan",
+    "nan_mask": "masknan",
+    "BUILTIN_MASK_NAN": "masknan",
+    "hillshade_processor": "shading2d",
+    "multishade_processor": "shading2d",
+    "BUILTIN_SHADING": "shading2d",
+    "gaussian_smooth": "filter2d",
+    "BUILTIN_FILTERS": "filter2d",
+    "apply_dark_pres_mono_style": "style2d",
+    "apply_color_pres_style": "style2d",
+    "apply_paper_style": "style2d",
+    "apply_bw_paper_style": "style2d",
+    "apply_nothing_style": "style2d",
+    "get_style": "style2d",
+    "get_style_dict": "style2d",
+    "convert_ticks_to_km": "helper2d",
+    "add_grid_crosses": "helper2d",
+    "add_colorbar": "helper2d",
+    "set_font": "helper2d_text",
+    "set_font_size": "helper2d_text",
+    "set_font_style": "helper2d_text",
+    "set_font_color": "helper2d_text",
+}
+
+_SUBMODULES = frozenset(_LAZY.values()) | {"map_object"}
+
+
+def __getattr__(name: str):
+    """Import lazily exported names and submodules on first access."""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
+
 
 __all__ = [
     "MapObject",
     "ProcessingFunction",
     "ProcessorFactory",
     "expand_plottables",
+    "expand_plottables_many",
     "is_plottable",
     "processor",
     "scale",
@@ -79,6 +120,7 @@ __all__ = [
     "nan_equal",
     "nan_below",
     "nan_above",
+    "nan_filter",
     "nan_mask",
     "hillshade_processor",
     "multishade_processor",
@@ -102,6 +144,7 @@ __all__ = [
     "apply_nothing_style",
     "set_style",
     "get_style",
+    "get_style_dict",
     "convert_ticks_to_km",
     "add_grid_crosses",
     "set_font",
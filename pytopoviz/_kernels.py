@@ -0,0 +1,405 @@
+"""Numba kernels backing the shading and masking helpers.
+
+Author: B.G.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Rows per parallel band in the shading kernels (halo rows are re-read).
+BLOCK_ROWS = 64
+
+# Horn (1981) cross-stencil weights; Numba freezes these as constants.
+HORN_WEIGHTS = np.array([1.0, 2.0, 1.0], dtype=np.float32)
+HORN_WEIGHT_SUM = np.float32(4.0)
+
+
+@njit(inline="always")
+def _axis_gradient(zm, z0, zp, idx, n):
+    """Central difference with second-order one-sided stencils at the edges."""
+    if n < 2:
+        return 0.0
+    if n == 2:
+        return zp - zm
+    if idx == 0:
+        return 0.5 * (-3.0 * z0 + 4.0 * zp - zm)
+    if idx == n - 1:
+        return 0.5 * (3.0 * z0 - 4.0 * zm + zp)
+    return 0.5 * (zp - zm)
+
+
+@njit(inline="always")
+def _neighbours(idx, n):
+    """Indices feeding ``_axis_gradient`` (edges reuse the two inner cells)."""
+    if n < 2:
+        return idx, idx
+    if n == 2:
+        return 0, 1
+    if idx == 0:
+        return 2, 1
+    if idx == n - 1:
+        return n - 2, n - 3
+    return idx - 1, idx + 1
+
+
+@njit(inline="always")
+def _clamped_neighbours(idx, n):
+    """Neighbour indices for Horn's stencil, replicated at the edges."""
+    return max(idx - 1, 0), min(idx + 1, n - 1)
+
+
+@njit(inline="always")
+def _shade(gx, gy, lights, weight):
+    """Mean Lambertian shade of the surface normal ``(-gx, -gy, 1)``."""
+    inv_norm = 1.0 / np.sqrt(gx * gx + gy * gy + 1.0)
+    acc = 0.0
+    for k in range(lights.shape[0]):
+        acc += lights[k, 2] - gx * lights[k, 0] - gy * lights[k, 1]
+    return acc * inv_norm * weight
+
+
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def multishade_fused(z, scale, lights, out):
+    """Average hillshade of ``z`` for every light vector in ``lights``.
+
+    Gradient, surface normal and the per-light dot products are computed in a
+    single pass, so no intermediate grids are allocated. ``scale`` is the
+    vertical exaggeration divided by the cell size, and ``lights`` holds one
+    ``(lx, ly, lz)`` row per light in image coordinates (x along columns,
+    y along rows). NaN-free input is expected.
+
+    Rows are processed in bands of ``BLOCK_ROWS`` per thread so the three-row
+    stencil window stays in cache while a band is swept.
+    """
+    ny, nx = z.shape
+    weight = 1.0 / lights.shape[0]
+    nblocks = (ny + BLOCK_ROWS - 1) // BLOCK_ROWS
+    for block in prange(nblocks):
+        # parfor indices are unsigned; keep neighbour arithmetic signed
+        start = np.int64(block) * BLOCK_ROWS
+        stop = min(start + BLOCK_ROWS, ny)
+        for i in range(start, stop):
+            im, ip = _neighbours(i, ny)
+            for j in range(nx):
+                jm, jp = _neighbours(j, nx)
+                z0 = z[i, j]
+                gx = _axis_gradient(z[i, jm], z0, z[i, jp], j, nx) * scale
+                gy = _axis_gradient(z[im, j], z0, z[ip, j], i, ny) * scale
+                out[i, j] = _shade(gx, gy, lights, weight)
+    return out
+
+
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def multishade_horn(z, scale, lights, out):
+    """Same as ``multishade_fused`` with Horn's 3x3 gradient stencil.
+
+    Each derivative is the ``HORN_WEIGHTS``-weighted mean of the central
+    differences of the three neighbouring rows (or columns), as in GDAL.
+    Edge cells replicate their border neighbours and fall back to one-sided
+    differences.
+    """
+    ny, nx = z.shape
+    weight = 1.0 / lights.shape[0]
+    w0 = HORN_WEIGHTS[0]
+    w1 = HORN_WEIGHTS[1]
+    w2 = HORN_WEIGHTS[2]
+    nblocks = (ny + BLOCK_ROWS - 1) // BLOCK_ROWS
+    for block in prange(nblocks):
+        start = np.int64(block) * BLOCK_ROWS
+        stop = min(start + BLOCK_ROWS, ny)
+        for i in range(start, stop):
+            im, ip = _clamped_neighbours(i, ny)
+            span_y = ip - im
+            for j in range(nx):
+                jm, jp = _clamped_neighbours(j, nx)
+                span_x = jp - jm
+                gx = 0.0
+                if span_x > 0:
+                    gx = (
+                        w0 * (z[im, jp] - z[im, jm])
+                        + w1 * (z[i, jp] - z[i, jm])
+                        + w2 * (z[ip, jp] - z[ip, jm])
+                    ) * (scale / (HORN_WEIGHT_SUM * span_x))
+                gy = 0.0
+                if span_y > 0:
+                    gy = (
+                        w0 * (z[ip, jm] - z[im, jm])
+                        + w1 * (z[ip, j] - z[im, j])
+                        + w2 * (z[ip, jp] - z[im, jp])
+                    ) * (scale / (HORN_WEIGHT_SUM * span_y))
+                out[i, j] = _shade(gx, gy, lights, weight)
+    return out
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def nan_equal_inplace(values, target):
+    """Set entries of ``values`` equal to ``target`` to NaN, in place."""
+    ny, nx = values.shape
+    for i in prange(ny):
+        for j in range(nx):
+            if values[i, j] == target:
+                values[i, j] = np.nan
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def nan_below_inplace(values, threshold):
+    """Set entries of ``values`` <= ``threshold`` to NaN, in place."""
+    ny, nx = values.shape
+    for i in prange(ny):
+        for j in range(nx):
+            if values[i, j] <= threshold:
+                values[i, j] = np.nan
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def nan_above_inplace(values, threshold):
+    """Set entries of ``values`` >= ``threshold`` to NaN, in place."""
+    ny, nx = values.shape
+    for i in prange(ny):
+        for j in range(nx):
+            if values[i, j] >= threshold:
+                values[i, j] = np.nan
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def nan_thresholds_inplace(values, equal, below, above):
+    """Set entries ``== equal``, ``<= below`` or ``>= above`` to NaN in one pass.
+
+    A NaN threshold disables its test, since NaN never compares true. This
+    matches ``nan_equal_inplace``, ``nan_below_inplace`` and
+    ``nan_above_inplace`` applied one after the other.
+    """
+    ny, nx = values.shape
+    for row in prange(ny):
+        i = np.int64(row)
+        for j in range(nx):
+            v = values[i, j]
+            if (v == equal) | (v <= below) | (v >= above):
+                values[i, j] = np.nan
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def finite_minmax(z):
+    """Return ``(min, max)`` over finite entries; ``(inf, -inf)`` when none."""
+    ny, nx = z.shape
+    lows = np.full(ny, np.inf)
+    highs = np.full(ny, -np.inf)
+    for i in prange(ny):
+        lo = np.inf
+        hi = -np.inf
+        for j in range(nx):
+            v = z[i, j]
+            if np.isfinite(v):
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+        lows[i] = lo
+        highs[i] = hi
+    return lows.min(), highs.max()
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def prepare_finite(src, out):
+    """Cast ``src`` into float32 ``out`` with non-finite entries as NaN.
+
+    Returns ``(min, max)`` of the finite float32 values from the same sweep,
+    ``(inf, -inf)`` when there are none. ``out`` may be ``src`` itself.
+    """
+    ny, nx = src.shape
+    lows = np.full(ny, np.inf)
+    highs = np.full(ny, -np.inf)
+    for i in prange(ny):
+        lo = np.inf
+        hi = -np.inf
+        for j in range(nx):
+            v = np.float32(src[i, j])
+            if np.isfinite(v):
+                out[i, j] = v
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+            else:
+                out[i, j] = np.nan
+        lows[i] = lo
+        highs[i] = hi
+    return lows.min(), highs.max()
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def finite_sum_count(z):
+    """Return the sum and the number of finite entries of ``z``."""
+    ny, nx = z.shape
+    total = 0.0
+    count = 0
+    for i in prange(ny):
+        for j in range(nx):
+            v = z[i, j]
+            if np.isfinite(v):
+                total += v
+                count += 1
+    return total, count
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def nan_finite_counts(values):
+    """Return ``(n_nan, n_finite)`` for ``values`` in one read-only sweep."""
+    ny, nx = values.shape
+    n_nan = 0
+    n_finite = 0
+    for i in prange(ny):
+        for j in range(nx):
+            v = values[i, j]
+            if np.isfinite(v):
+                n_finite += 1
+            elif np.isnan(v):
+                n_nan += 1
+    return n_nan, n_finite
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def fill_nonfinite(values, fill, out):
+    """Copy ``values`` into ``out`` with non-finite entries set to ``fill``."""
+    ny, nx = values.shape
+    for i in prange(ny):
+        for j in range(nx):
+            v = values[i, j]
+            out[i, j] = v if np.isfinite(v) else fill
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def nan_where_nan(source, out):
+    """Set ``out`` to NaN wherever ``source`` is NaN, in place."""
+    ny, nx = source.shape
+    for i in prange(ny):
+        for j in range(nx):
+            if np.isnan(source[i, j]):
+                out[i, j] = np.nan
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def build_surface_points(x, y, z, z_scale, points):
+    """Fill the ``(ny * nx, 3)`` VTK point array of a structured surface.
+
+    Points follow VTK's structured ordering (``k = i + j * ny``, rows fastest);
+    NaN heights are set to 0 and the rest multiplied by ``z_scale``.
+    """
+    ny, nx = z.shape
+    for col in prange(nx):
+        j = np.int64(col)
+        xj = x[j]
+        base = j * ny
+        for i in range(ny):
+            v = z[i, j]
+            k = base + i
+            points[k, 0] = xj
+            points[k, 1] = y[i]
+            points[k, 2] = 0.0 if np.isnan(v) else v * z_scale
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def transpose_with_mask(values, values_t, valid_t):
+    """Write ``values.T`` and ``~isnan(values).T``; return the number of NaNs.
+
+    Both outputs are filled in the same sweep. The transposed C-ordered arrays
+    ravel to the Fortran order used by VTK structured grids without another
+    copy.
+    """
+    ny, nx = values.shape
+    missing = 0
+    for j in prange(nx):
+        for i in range(ny):
+            v = values[i, j]
+            ok = not np.isnan(v)
+            values_t[j, i] = v
+            valid_t[j, i] = ok
+            if not ok:
+                missing += 1
+    return missing
+
+
+# Boundary handling codes shared with ``filter2d`` (scipy.ndimage names).
+MODE_REFLECT = 0
+MODE_MIRROR = 1
+MODE_NEAREST = 2
+MODE_WRAP = 3
+MODE_CONSTANT = 4
+
+
+@njit(inline="always")
+def _boundary_index(idx, n, mode):
+    """Map ``idx`` into ``[0, n)`` following ``mode``; -1 means zero padding."""
+    if 0 <= idx < n:
+        return idx
+    if mode == MODE_CONSTANT:
+        return -1
+    if mode == MODE_NEAREST:
+        return 0 if idx < 0 else n - 1
+    if mode == MODE_WRAP:
+        return idx % n
+    if mode == MODE_MIRROR:
+        if n == 1:
+            return 0
+        period = 2 * n - 2
+        idx = idx % period
+        return period - idx if idx >= n else idx
+    period = 2 * n
+    idx = idx % period
+    return period - 1 - idx if idx >= n else idx
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def nan_gaussian_rows(data, kernel, mode, out_sum, out_weight):
+    """First separable pass (along axis 0) of a NaN-aware Gaussian.
+
+    Accumulates the kernel-weighted sum of finite values and the matching
+    weight of finite samples in one sweep, without a filled copy or mask.
+    Whole source rows are streamed per tap so the inner loop stays contiguous.
+    """
+    ny, nx = data.shape
+    radius = (kernel.shape[0] - 1) // 2
+    for row in prange(ny):
+        i = np.int64(row)
+        for j in range(nx):
+            out_sum[i, j] = 0.0
+            out_weight[i, j] = 0.0
+        for t in range(-radius, radius + 1):
+            ii = _boundary_index(i + t, ny, mode)
+            if ii < 0:
+                continue
+            k = kernel[t + radius]
+            for j in range(nx):
+                v = data[ii, j]
+                if np.isfinite(v):
+                    out_sum[i, j] += k * v
+                    out_weight[i, j] += k
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def nan_gaussian_cols(partial_sum, partial_weight, kernel, mode, out):
+    """Second separable pass (along axis 1); renormalises by the weights.
+
+    Cells whose support holds no finite sample are set to NaN.
+    """
+    ny, nx = partial_sum.shape
+    radius = (kernel.shape[0] - 1) // 2
+    for row in prange(ny):
+        i = np.int64(row)
+        for j in range(nx):
+            acc = 0.0
+            wsum = 0.0
+            if radius <= j < nx - radius:
+                for t in range(-radius, radius + 1):
+                    k = kernel[t + radius]
+                    acc += k * partial_sum[i, j + t]
+                    wsum += k * partial_weight[i, j + t]
+            else:
+                for t in range(-radius, radius + 1):
+                    jj = _boundary_index(j + t, nx, mode)
+                    if jj < 0:
+                        continue
+                    k = kernel[t + radius]
+                    acc += k * partial_sum[i, jj]
+                    wsum += k * partial_weight[i, jj]
+            out[i, j] = acc / wsum if wsum > 0.0 else np.nan
@@ -3,28 +3,74 @@
 Author: B.G.
 """
 
-from typing import Any, Iterable, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Tuple, Union
 
+import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
 
 from topotoolbox import GridObject
 
 from .helper2d import add_colorbar, add_grid_crosses, convert_ticks_to_km, finalize_figsize
 from .map_object import MapObject
-from .processing import expand_plottables, is_plottable
+from .processing import expand_plottables_many, is_plottable
 
 __all__ = ["quickmap", "Fig2DObject"]
 
+# ``plt.subplots`` keywords that belong to ``Figure.subplots``; the rest
+# configure the Figure itself.
+_SUBPLOTS_KEYS = (
+    "nrows",
+    "ncols",
+    "sharex",
+    "sharey",
+    "squeeze",
+    "width_ratios",
+    "height_ratios",
+    "subplot_kw",
+    "gridspec_kw",
+)
+
+
+def _colorize(value: np.ndarray, cmap, norm: Normalize, alpha: float | None) -> np.ndarray:
+    """Apply ``cmap`` and ``norm`` once, returning a uint8 RGBA image.
+
+    NaNs take the colormap's "bad" colour (transparent by default) and the
+    layer alpha is folded into the alpha channel.
+    """
+    rgba = cmap(norm(value), bytes=True)
+    if alpha is not None and alpha != 1.0:
+        rgba[..., 3] = (rgba[..., 3] * float(alpha)).astype(np.uint8)
+    return rgba
+
 
 class Fig2DObject:
     """
     Wrapper around a matplotlib figure and axes to manage 2D map layers.
     Stores plotted artists keyed by MapObject for convenient access.
+
+    With ``interactive=False`` the figure is bound to an Agg canvas and never
+    registered with pyplot, which is cheaper for scripted rendering; such
+    figures are not shown by ``plt.show()`` but can still be saved.
     """
 
-    def __init__(self, **subplots_kwargs):
-        fig, axes = plt.subplots(**subplots_kwargs)
+    def __init__(self, *, interactive: bool = True, **subplots_kwargs):
+        if interactive:
+            fig, axes = plt.subplots(**subplots_kwargs)
+        else:
+            grid_kwargs = {
+                key: subplots_kwargs.pop(key)
+                for key in _SUBPLOTS_KEYS
+                if key in subplots_kwargs
+            }
+            fig = Figure(**subplots_kwargs)
+            FigureCanvasAgg(fig)
+            axes = fig.subplots(**grid_kwargs)
         if isinstance(axes, np.ndarray):
             axes_list = axes.ravel().tolist()
         elif axes is None:
@@ -34,9 +80,40 @@ class Fig2DObject:
 
         self.fig = fig
         self.axes = axes_list
-        self.images: dict[MapObject, Any] = {}
-        self.colorbars: dict[MapObject, Any] = {}
+        # Plotted layers are stored as parallel lists indexed by plot order.
+        self._layer_maps: list[MapObject] = []
+        self._layer_images: list[Any] = []
+        self._layer_cbars: list[Any | None] = []
+        # (cmap, norm, alpha) for layers drawn as pre-coloured RGBA, else None.
+        self._layer_colorizers: list[tuple | None] = []
         self.base_maps: list[MapObject] = []
+        # Axis backgrounds captured by ``enable_blit``; empty when blitting is off.
+        self._backgrounds: dict[Any, Any] = {}
+
+    @property
+    def images(self) -> Mapping[MapObject, Any]:
+        """Read-only mapping of plotted MapObject to its image artist.
+
+        The mapping is a snapshot built from the layer lists; layers are added
+        through ``add_maps``, so item assignment and deletion raise TypeError.
+        """
+        return MappingProxyType(dict(zip(self._layer_maps, self._layer_images)))
+
+    @property
+    def colorbars(self) -> Mapping[MapObject, Any]:
+        """Read-only mapping of plotted MapObject to its colorbar, if it has one."""
+        return MappingProxyType({
+            mapper: cbar
+            for mapper, cbar in zip(self._layer_maps, self._layer_cbars)
+            if cbar is not None
+        })
+
+    def image_for(self, mapper: MapObject):
+        """Return the image artist most recently plotted for ``mapper``."""
+        for idx in range(len(self._layer_maps) - 1, -1, -1):
+            if self._layer_maps[idx] is mapper:
+                return self._layer_images[idx]
+        raise KeyError(mapper.name)
 
     @property
     def ax(self):
@@ -46,33 +123,123 @@ class Fig2DObject:
 
     def save(self, **kwargs):
         """Forward to matplotlib's savefig."""
-        return self.fig.savefig(**kwargs)
+        # Animated (blitted) layers are skipped by a regular draw, so
+        # un-animate them for the duration of the save.
+        animated = [im for im in self._layer_images if im.get_animated()]
+        for im in animated:
+            im.set_animated(False)
+        try:
+            return self.fig.savefig(**kwargs)
+        finally:
+            for im in animated:
+                im.set_animated(True)
+
+    def enable_blit(self):
+        """
+        Cache the static parts of every axis so layers can be blitted.
+
+        Layer images are marked animated and the figure is drawn once without
+        them; ticks, labels, colorbars and decorations are then kept as a
+        pixel background that ``update_layer`` restores instead of redrawing.
+        Requires a canvas that supports ``copy_from_bbox`` (e.g. Agg).
+        """
+        for im in self._layer_images:
+            im.set_animated(True)
+        canvas = self.fig.canvas
+        canvas.draw()
+        self._backgrounds = {axis: canvas.copy_from_bbox(axis.bbox) for axis in self.axes}
+        for axis in self.axes:
+            self._blit_axis(axis)
+
+    def update_layer(self, mapper: MapObject, new_value: np.ndarray):
+        """
+        Replace the image data of ``mapper``'s layer and refresh its axis.
+
+        With blitting enabled only the layer images of that axis are redrawn
+        over the cached background; otherwise an idle redraw is requested.
+        The MapObject itself is left untouched. Layers added with
+        ``rgba=True`` are re-coloured with their original colormap and norm.
+        """
+        im = self.image_for(mapper)
+        colorizer = self._layer_colorizers[self._layer_images.index(im)]
+        if colorizer is not None:
+            new_value = _colorize(new_value, *colorizer)
+        im.set_data(new_value)
+        if im.axes in self._backgrounds:
+            self._blit_axis(im.axes)
+        else:
+            self.fig.canvas.draw_idle()
+        return im
 
-    def add_maps(self, axis, *maps: Union[MapObject, GridObject]):
-        """Add one or more MapObjects to the provided axis."""
+    def _blit_axis(self, axis):
+        """Restore ``axis`` background and redraw its layers in plot order."""
+        canvas = self.fig.canvas
+        canvas.restore_region(self._backgrounds[axis])
+        for im in self._layer_images:
+            if im.axes is axis:
+                axis.draw_artist(im)
+        canvas.blit(axis.bbox)
+
+    def add_maps(self, axis, *maps: Union[MapObject, GridObject], rgba: bool = False):
+        """Add one or more MapObjects to the provided axis.
+
+        With ``rgba=True`` each layer is colour-mapped once between its
+        ``vmin`` and ``vmax`` and drawn as a uint8 RGBA image with
+        ``interpolation="none"``, so redraws skip the float-to-colour pass; the
+        image artists then hold RGBA data and colorbars use a stand-in
+        ScalarMappable.
+        """
         if not maps:
             raise ValueError("Provide at least one MapObject or GridObject to add.")
 
         map_list: Tuple[MapObject, ...] = tuple(_ensure_map(m) for m in maps)
         self.base_maps.extend(map_list)
-        plot_list: list[MapObject] = []
-        for mapper in map_list:
-            # Expand processors so derived layers (e.g., hillshade) get plotted too.
-            plot_list.extend(expand_plottables(mapper, mode="2d"))
-
-        for mapper in plot_list:
-            if not is_plottable(mapper):
-                continue
-            im = axis.imshow(
-                mapper.value,
-                cmap=mapper.cmap,
-                alpha=mapper.alpha,
-                extent=mapper.grid.extent,
-            )
-            self.images[mapper] = im
-            if isinstance(mapper.cbar, str):
-                cbar = add_colorbar(axis, im, label=mapper.cbar)
-                self.colorbars[mapper] = cbar
+        # Expand processors so derived layers (e.g., hillshade) get plotted too.
+        plot_list: list[MapObject] = [
+            layer
+            for expanded in expand_plottables_many(map_list, mode="2d")
+            for layer in expanded
+        ]
+
+        plot_list = [mapper for mapper in plot_list if is_plottable(mapper)]
+        # Image pass keeps plot order; colorbars are only built for labelled layers.
+        colorizers: list[tuple | None] = [None] * len(plot_list)
+        if rgba:
+            images = []
+            for idx, mapper in enumerate(plot_list):
+                cmap = matplotlib.colormaps.get_cmap(mapper.cmap)
+                colorizers[idx] = (cmap, Normalize(mapper.vmin, mapper.vmax), mapper.alpha)
+                images.append(
+                    axis.imshow(
+                        _colorize(mapper.value, *colorizers[idx]),
+                        interpolation="none",
+                        origin="upper",
+                        extent=mapper.extent,
+                    )
+                )
+        else:
+            images = [
+                axis.imshow(
+                    mapper.value,
+                    cmap=mapper.cmap,
+                    alpha=mapper.alpha,
+                    extent=mapper.extent,
+                )
+                for mapper in plot_list
+            ]
+        labelled = [idx for idx, mapper in enumerate(plot_list) if isinstance(mapper.cbar, str)]
+        cbars: list[Any | None] = [None] * len(plot_list)
+        for idx in labelled:
+            mappable = images[idx]
+            if colorizers[idx] is not None:
+                cmap, norm, _ = colorizers[idx]
+                mappable = ScalarMappable(norm=norm, cmap=cmap)
+            cbars[idx] = add_colorbar(axis, mappable, label=plot_list[idx].cbar)
+
+        self._layer_maps.extend(plot_list)
+        self._layer_images.extend(images)
+        self._layer_cbars.extend(cbars)
+        self._layer_colorizers.extend(colorizers)
         return axis
 
 
@@ -85,9 +252,18 @@ def _ensure_map(obj: Union[MapObject, GridObject]) -> MapObject:
     raise TypeError("quickmap accepts MapObject or GridObject instances.")
 
 
-def quickmap(*maps: Union[MapObject, GridObject]):
+def quickmap(
+    *maps: Union[MapObject, GridObject],
+    interactive: bool = True,
+    rgba: bool = False,
+):
     """Plot one or more MapObjects on a single axis, in order.
 
+    By default the figure is created through pyplot, so ``plt.show()`` displays
+    it. Pass ``interactive=False`` to render on an Agg canvas outside pyplot
+    instead (faster for batch export with ``fig.savefig``).
+    ``rgba=True`` pre-colours the layers (see ``Fig2DObject.add_maps``).
+
     Returns
     -------
     (fig, ax)
@@ -99,11 +275,13 @@ def quickmap(*maps: Union[MapObject, GridObject]):
     map_list: Tuple[MapObject, ...] = tuple(_ensure_map(m) for m in maps)
 
     figsize = finalize_figsize(map_list)
-    fig_obj = Fig2DObject(figsize=figsize, constrained_layout=True, layout=None)
+    fig_obj = Fig2DObject(
+        interactive=interactive, figsize=figsize, constrained_layout=True, layout=None
+    )
     fig_obj.fig.set_constrained_layout_pads(w_pad=0.05, h_pad=0.05, wspace=0.02, hspace=0.02)
 
     ax = fig_obj.ax
-    fig_obj.add_maps(ax, *map_list)
+    fig_obj.add_maps(ax, *map_list, rgba=rgba)
 
     ax.set_xlabel("Easting (km)")
     ax.set_ylabel("Northing (km)")
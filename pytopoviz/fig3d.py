@@ -3,15 +3,20 @@
 Author: B.G.
 """
 
-from typing import Dict, Iterable, Tuple, Union
+from __future__ import annotations
+
+import zlib
+from typing import TYPE_CHECKING, Dict, Iterable, Tuple, Union
 
 import numpy as np
-import pyvista as pv
 
 from topotoolbox import GridObject
 
 from .map_object import MapObject
-from .processing import is_plottable, _processor_is_compatible
+from .processing import is_plottable, _compatible_processors
+
+if TYPE_CHECKING:
+    import pyvista as pv
 
 __all__ = ["quickmap3d", "Fig3DObject"]
 
@@ -25,13 +30,50 @@ def _ensure_map(obj: Union[MapObject, GridObject]) -> MapObject:
     raise TypeError("quickmap3d accepts MapObject or GridObject instances.")
 
 
-def _structured_grid_from_map(
-    mapper: MapObject,
+def _value_fingerprint(value: np.ndarray) -> tuple:
+    """Cheap content key of a float32 value array (shape and CRC-32 of its bytes).
+
+    Values are edited in place by processors and users, so cached geometry is
+    validated on content rather than on array identity.
+    """
+    data = np.ascontiguousarray(value)
+    return data.shape, data.dtype.str, zlib.crc32(memoryview(data).cast("B"))
+
+
+def _lod_stride(shape: Tuple[int, ...], max_dim: int | None) -> int:
+    """Smallest stride keeping the longest grid side within ``max_dim`` nodes."""
+    if max_dim is None or max_dim <= 0:
+        return 1
+    return max(1, -(-max(shape) // int(max_dim)))
+
+
+def _coordinate_dtype(bounds: Tuple[float, ...], step: float) -> type:
+    """Use float32 node coordinates unless that would jitter nodes.
+
+    Projected coordinates can be large (e.g. UTM northings), so float32 is
+    only used when its resolution at the largest coordinate stays below a
+    thousandth of the node spacing.
+    """
+    max_abs = max(abs(float(b)) for b in bounds)
+    resolution = float(np.spacing(np.float32(max_abs)))
+    if step > 0 and resolution <= 1e-3 * step:
+        return np.float32
+    return np.float64
+
+
+def _surface_geometry(
     surface_map: MapObject,
     z_exaggeration: float | None = None,
-) -> Tuple[pv.StructuredGrid, str]:
-    """Build a StructuredGrid using surface values and mapper scalars."""
-    scalars = mapper.value
+    max_dim: int | None = None,
+) -> Tuple[pv.StructuredGrid, int]:
+    """Build the (decimated) StructuredGrid geometry of ``surface_map``.
+
+    Returns the grid, without scalars, and the stride used for decimation.
+    """
+    import pyvista as pv  # local imports keep pyvista and numba lazy
+
+    from ._kernels import build_surface_points, finite_minmax
+
     z = surface_map.value
     cellsize = getattr(surface_map.grid, "cellsize", 1.0)
     cellsize_value = float(np.asarray(cellsize).ravel()[0]) if cellsize is not None else 1.0
@@ -42,8 +84,8 @@ def _structured_grid_from_map(
         xmin, xmax, ymin, ymax = surface_map.grid.extent
         span_units = max(xmax - xmin, ymax - ymin)
         span_cells = span_units / cellsize_value if cellsize_value > 0 else span_units
-        finite = np.isfinite(z)
-        z_range = float(np.nanmax(z) - np.nanmin(z)) if finite.any() else 0.0
+        z_low, z_high = finite_minmax(z)
+        z_range = float(z_high - z_low) if z_high >= z_low else 0.0
         if z_range > 0:
             target_relief = 3.2 * span_cells
             z_scale = (target_relief / z_range) * z_factor
@@ -54,18 +96,63 @@ def _structured_grid_from_map(
     ny, nx = z.shape
     xmin, xmax, ymin, ymax = surface_map.grid.extent
 
-    x = np.linspace(xmin, xmax, nx)
-    y = np.linspace(ymin, ymax, ny)
-    xx, yy = np.meshgrid(x, y)
+    # Strided level of detail: keep exact node positions, drop the rest.
+    stride = _lod_stride(z.shape, max_dim)
+    step = min(
+        abs(xmax - xmin) / max(nx - 1, 1),
+        abs(ymax - ymin) / max(ny - 1, 1),
+    ) * stride
+    # The point array takes the x dtype, so this also sets the upload precision.
+    coord_dtype = _coordinate_dtype((xmin, xmax, ymin, ymax), step)
+    x = np.linspace(xmin, xmax, nx, dtype=coord_dtype)[::stride]
+    y = np.linspace(ymin, ymax, ny, dtype=coord_dtype)[::stride]
+    z = z[::stride, ::stride]
+
+    # Coordinates and filled, scaled heights are written straight into VTK's
+    # point layout in one pass. Chained scale processors only fold into
+    # z_scale_factor, so this is the single multiply.
+    sny, snx = z.shape
+    points = np.empty((sny * snx, 3), dtype=coord_dtype)
+    build_surface_points(x, y, z, z_scale, points)
+    grid = pv.StructuredGrid()
+    grid.points = points
+    grid.dimensions = (sny, snx, 1)
+    return grid, stride
 
-    # Geometry uses filled values; scalar array preserves NaNs for transparency.
-    grid = pv.StructuredGrid(xx, yy, np.nan_to_num(z, nan=0.0) * z_scale)
+
+def _structured_grid_from_map(
+    mapper: MapObject,
+    surface_map: MapObject,
+    z_exaggeration: float | None = None,
+    max_dim: int | None = None,
+    geometry: Tuple[pv.StructuredGrid, int] | None = None,
+) -> Tuple[pv.StructuredGrid, str]:
+    """Build a StructuredGrid using surface values and mapper scalars.
+
+    When ``max_dim`` is set, geometry and scalars are decimated by a common
+    stride so the longest side has at most ``max_dim`` nodes. A prebuilt
+    ``geometry`` from ``_surface_geometry`` is reused through a shallow copy
+    so several layers can share one point array.
+    """
+    from ._kernels import transpose_with_mask
+
+    if geometry is None:
+        geometry = _surface_geometry(surface_map, z_exaggeration=z_exaggeration, max_dim=max_dim)
+    base, stride = geometry
+    grid = base.copy(deep=False)
+
+    # Scalar array preserves NaNs for transparency.
+    # VTK wants point data in Fortran order: the scalars and their validity
+    # mask are transposed into C order together, in a single pass.
+    scalars = mapper.value[::stride, ::stride]
+    scalars_t = np.empty(scalars.shape[::-1], dtype=scalars.dtype)
+    valid_t = np.empty(scalars.shape[::-1], dtype=np.bool_)
+    n_missing = transpose_with_mask(scalars, scalars_t, valid_t)
     scalars_name = "scalars"
-    grid[scalars_name] = scalars.ravel(order="F")
+    grid[scalars_name] = scalars_t.ravel()
 
-    mask = np.isnan(scalars)
-    if mask.any():
-        grid = grid.extract_points(~mask.ravel(order="F"), adjacent_cells=True)
+    if n_missing:
+        grid = grid.extract_points(valid_t.ravel(), adjacent_cells=True)
 
     return grid, scalars_name
 
@@ -80,7 +167,10 @@ class Fig3DObject:
         smooth_shading: bool = True,
         show_scalar_bar: bool = True,
         z_exaggeration: float | None = None,
+        max_dim: int | None = 1024,
     ):
+        import pyvista as pv
+
         self.plotter = pv.Plotter()
         self.plotter.set_background(background)
         self.plotter.enable_eye_dome_lighting()
@@ -88,8 +178,17 @@ class Fig3DObject:
         self.smooth_shading = smooth_shading
         self.show_scalar_bar = show_scalar_bar
         self.z_exaggeration = None if z_exaggeration is None else float(z_exaggeration)
+        # Longest side (in nodes) of rendered meshes; None renders every cell.
+        self.max_dim = None if max_dim is None else int(max_dim)
 
         self.meshes: Dict[MapObject, pv.Actor] = {}
+        # Actors keyed by (id of the base map, layer position in its chain), so
+        # re-adding a map updates its actors instead of uploading new meshes.
+        self._layers: Dict[tuple, tuple] = {}
+        # Surface geometry reused across layers and calls, keyed by the surface
+        # grid and scaling inputs; entries hold the height array they were
+        # built from so a reassigned value is detected.
+        self._mesh_cache: Dict[tuple, tuple] = {}
         self._light: pv.Light | None = None
         self._light_added = False
         self._pending_camera_position = None
@@ -97,21 +196,24 @@ class Fig3DObject:
 
     def add_maps(self, *maps: Union[MapObject, GridObject], surface_map: Union[MapObject, GridObject, None] = None):
         """Add MapObjects to the plotter after applying processors in order."""
+        import pyvista as pv
+
         if not maps:
             raise ValueError("Provide at least one MapObject or GridObject to add.")
 
         map_list_raw = tuple(_ensure_map(m) for m in maps)
         self.base_maps.extend(map_list_raw)
-        plot_list: list[tuple[MapObject, MapObject]] = []
+        plot_list: list[tuple[MapObject, MapObject, tuple]] = []
+        positions: Dict[int, int] = {}
         surface_map_override = _ensure_map(surface_map) if surface_map is not None else None
         default_surface = surface_map_override if surface_map_override is not None else map_list_raw[0]
 
-        def collect(current: MapObject, inherited_surface: MapObject):
+        def collect(current: MapObject, inherited_surface: MapObject, root: MapObject):
             surface_map = inherited_surface if current.draped else current
-            plot_list.append((current, surface_map))
-            for proc in current.processors:
-                if not _processor_is_compatible(proc, "3d"):
-                    continue
+            position = positions.get(id(root), 0)
+            positions[id(root)] = position + 1
+            plot_list.append((current, surface_map, (id(root), position)))
+            for proc in _compatible_processors(current, "3d"):
                 produced = proc(current)
                 if produced is None:
                     continue
@@ -123,12 +225,12 @@ class Fig3DObject:
                 for item in produced_list:
                     if not is_plottable(item):
                         continue
-                    collect(item, next_inherited)
+                    collect(item, next_inherited, root)
 
         for mapper in map_list_raw:
-            collect(mapper, default_surface)
+            collect(mapper, default_surface, mapper)
 
-        for idx, (mapper, surface_map) in enumerate(plot_list):
+        for mapper, surface_map, layer_key in plot_list:
             if mapper.eye_dome_lighting is not None:
                 if mapper.eye_dome_lighting:
                     self.plotter.enable_eye_dome_lighting()
@@ -152,17 +254,51 @@ class Fig3DObject:
                     self.plotter.add_light(self._light)
                     self._light_added = True
 
+            geometry = self._surface_geometry(surface_map)
             mesh, scalars_name = _structured_grid_from_map(
                 mapper,
                 surface_map,
                 z_exaggeration=self.z_exaggeration,
+                max_dim=self.max_dim,
+                geometry=geometry,
             )
             scalar_bar_args = {}
             if isinstance(mapper.cbar, str) and self.show_scalar_bar:
                 scalar_bar_args["title"] = mapper.cbar
             else:
                 scalar_bar_args["title"] = ""
+            smooth_shading = (
+                self.smooth_shading if mapper.smooth_shading is None else mapper.smooth_shading
+            )
+            # Anything baked into the actor at creation; scalars and clim are not.
+            style = (
+                mapper.cmap,
+                mapper.alpha,
+                smooth_shading,
+                scalar_bar_args["title"],
+                mapper.ambient,
+                mapper.diffuse,
+                mapper.specular,
+                mapper.specular_power,
+            )
+
+            # Same geometry, no NaN cut-out and same style: swap the scalars.
+            layer = self._layers.get(layer_key)
+            reusable = not isinstance(mesh, pv.UnstructuredGrid)
+            if (
+                layer is not None
+                and reusable
+                and layer[1] is geometry
+                and layer[2] == style
+                and layer[0].mapper.dataset.n_points == mesh.n_points
+            ):
+                actor = layer[0]
+                actor.mapper.dataset.point_data[scalars_name] = mesh.point_data[scalars_name]
+                actor.mapper.scalar_range = (mapper.vmin, mapper.vmax)
+                self.meshes[mapper] = actor
+                continue
 
+            name = f"map_{len(self._layers)}" if layer is None else layer[3]
             actor = self.plotter.add_mesh(
                 mesh,
                 scalars=scalars_name,
@@ -170,22 +306,45 @@ class Fig3DObject:
                 clim=(mapper.vmin, mapper.vmax),
                 opacity=mapper.alpha,
                 nan_opacity=0.0,
-                smooth_shading=self.smooth_shading
-                if mapper.smooth_shading is None
-                else mapper.smooth_shading,
+                smooth_shading=smooth_shading,
                 show_scalar_bar=bool(scalar_bar_args.get("title")),
                 scalar_bar_args=scalar_bar_args,
-                name=f"map_{idx}",
+                name=name,
                 ambient=mapper.ambient,
                 diffuse=mapper.diffuse,
                 specular=mapper.specular,
                 specular_power=mapper.specular_power,
             )
             self.meshes[mapper] = actor
+            self._layers[layer_key] = (actor, geometry if reusable else None, style, name)
         if self._pending_camera_position is not None:
             self.plotter.camera_position = self._pending_camera_position
         return self.plotter
 
+    def _surface_geometry(self, surface_map: MapObject) -> Tuple[pv.StructuredGrid, int]:
+        """Return cached surface geometry, rebuilding it when its inputs changed.
+
+        The cache is checked against the surface values' content, so in-place
+        edits (e.g. NaN processors) rebuild the geometry and its auto z scale.
+        """
+        key = (
+            id(surface_map.grid),
+            float(surface_map.z_scale_factor),
+            self.z_exaggeration,
+            self.max_dim,
+        )
+        fingerprint = _value_fingerprint(surface_map.value)
+        cached = self._mesh_cache.get(key)
+        if cached is not None and cached[0] is surface_map.grid and cached[1] == fingerprint:
+            return cached[2]
+        geometry = _surface_geometry(
+            surface_map,
+            z_exaggeration=self.z_exaggeration,
+            max_dim=self.max_dim,
+        )
+        self._mesh_cache[key] = (surface_map.grid, fingerprint, geometry)
+        return geometry
+
     def set_camera_position(self, camera_position):
         """Set the camera position tuple (position, focal point, view up)."""
         self._pending_camera_position = camera_position
@@ -212,6 +371,7 @@ class Fig3DObject:
             cpos = self.plotter.camera_position
         if print_camera:
             print(f"camera_position={cpos}")
+        # Captured after the window closes, so interactive camera moves are kept.
         if screenshot_path:
             self.plotter.screenshot(screenshot_path)
         if auto_close:
@@ -239,8 +399,13 @@ def quickmap3d(
     camera_position=None,
     print_camera: bool = True,
     surface_map: Union[MapObject, GridObject, None] = None,
+    max_dim: int | None = 1024,
 ):
-    """Display one or more MapObjects in 3D with PyVista and save a screenshot."""
+    """Display one or more MapObjects in 3D with PyVista and save a screenshot.
+
+    ``max_dim`` bounds the longest side of the rendered meshes (in nodes) by
+    strided decimation; pass ``None`` to render the full-resolution grid.
+    """
     if len(maps) == 0:
         raise ValueError("Provide at least one MapObject or GridObject.")
 
@@ -249,6 +414,7 @@ def quickmap3d(
         smooth_shading=smooth_shading,
         show_scalar_bar=show_scalar_bar,
         z_exaggeration=z_exaggeration,
+        max_dim=max_dim,
     )
     if camera_position is not None:
         fig.set_camera_position(camera_position)
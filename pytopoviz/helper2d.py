@@ -5,6 +5,8 @@ Author: B.G.
 
 from typing import Literal
 
+import numpy as np
+
 __all__ = [
     "convert_ticks_to_km",
     "add_grid_crosses",
@@ -13,6 +15,11 @@ __all__ = [
 ]
 
 
+def _km_formatter(x, _pos):
+    """Format a tick in meters as kilometers with one decimal."""
+    return format(x / 1000, ".1f")
+
+
 def convert_ticks_to_km(ax, axes: Literal["x", "y", "both"] = "both") -> None:
     """
     Convert axis tick labels from meters to kilometers.
@@ -26,17 +33,14 @@ def convert_ticks_to_km(ax, axes: Literal["x", "y", "both"] = "both") -> None:
     """
     from matplotlib.ticker import FuncFormatter
 
-    def km_formatter(x, _pos):
-        return f"{x/1000:.1f}"
-
     if axes in ("x", "both"):
-        ax.xaxis.set_major_formatter(FuncFormatter(km_formatter))
+        ax.xaxis.set_major_formatter(FuncFormatter(_km_formatter))
         xlabel = ax.get_xlabel()
         if xlabel and "m" in xlabel.lower() and "km" not in xlabel.lower():
             ax.set_xlabel(xlabel.replace("m", "km").replace("M", "km"))
 
     if axes in ("y", "both"):
-        ax.yaxis.set_major_formatter(FuncFormatter(km_formatter))
+        ax.yaxis.set_major_formatter(FuncFormatter(_km_formatter))
         ylabel = ax.get_ylabel()
         if ylabel and "m" in ylabel.lower() and "km" not in ylabel.lower():
             ax.set_ylabel(ylabel.replace("m", "km").replace("M", "km"))
@@ -76,27 +80,37 @@ def add_grid_crosses(
     xlim = ax.get_xlim()
     ylim = ax.get_ylim()
 
-    xticks = [x for x in xticks if min(xlim) <= x <= max(xlim)]
-    yticks = [y for y in yticks if min(ylim) <= y <= max(ylim)]
-
-    minor_xticks = set(ax.get_xticks(minor=True)) if include_minor else set()
-    minor_yticks = set(ax.get_yticks(minor=True)) if include_minor else set()
-
-    for x in xticks:
-        for y in yticks:
-            is_minor = (x in minor_xticks) or (y in minor_yticks)
-            marker_size = size * 0.6 if is_minor else size
-            marker_alpha = alpha * 0.2 if is_minor else alpha
-            ax.plot(
-                x,
-                y,
-                "+",
-                color=color,
-                markersize=marker_size,
-                markeredgewidth=linewidth,
-                alpha=marker_alpha,
-                zorder=100,
-            )
+    xs = np.asarray(xticks, dtype=float)
+    ys = np.asarray(yticks, dtype=float)
+    xs = xs[(xs >= min(xlim)) & (xs <= max(xlim))]
+    ys = ys[(ys >= min(ylim)) & (ys <= max(ylim))]
+
+    minor_xticks = np.asarray(ax.get_xticks(minor=True) if include_minor else [], dtype=float)
+    minor_yticks = np.asarray(ax.get_yticks(minor=True) if include_minor else [], dtype=float)
+
+    # One marker-only artist per cross class instead of one artist per cross
+    grid_x, grid_y = np.meshgrid(xs, ys, indexing="ij")
+    grid_x = grid_x.ravel()
+    grid_y = grid_y.ravel()
+    is_minor = np.isin(grid_x, minor_xticks) | np.isin(grid_y, minor_yticks)
+
+    for selection, marker_size, marker_alpha in (
+        (~is_minor, size, alpha),
+        (is_minor, size * 0.6, alpha * 0.2),
+    ):
+        if not selection.any():
+            continue
+        ax.plot(
+            grid_x[selection],
+            grid_y[selection],
+            linestyle="none",
+            marker="+",
+            color=color,
+            markersize=marker_size,
+            markeredgewidth=linewidth,
+            alpha=marker_alpha,
+            zorder=100,
+        )
 
 def add_colorbar(ax, mappable, label=None, location="right", size="5%", pad=0.05, labelpad=5, shrink=1.0):
     """
@@ -190,17 +204,19 @@ def finalize_figsize(
     cbar_extra : float
         Additional width to reserve when a colorbar is present.
     """
-    xs: list[float] = []
-    ys: list[float] = []
+    x_lo = y_lo = float("inf")
+    x_hi = y_hi = float("-inf")
     has_cbar = False
     for mapper in mappers:
-        xmin, xmax, ymin, ymax = mapper.grid.extent
-        xs.extend([xmin, xmax])
-        ys.extend([ymin, ymax])
+        xmin, xmax, ymin, ymax = mapper.extent
+        x_lo = min(x_lo, xmin, xmax)
+        x_hi = max(x_hi, xmin, xmax)
+        y_lo = min(y_lo, ymin, ymax)
+        y_hi = max(y_hi, ymin, ymax)
         has_cbar = has_cbar or isinstance(mapper.cbar, str)
 
-    width = max(xs) - min(xs) if xs else 1.0
-    height = max(ys) - min(ys) if ys else 1.0
+    width = x_hi - x_lo if x_hi >= x_lo else 1.0
+    height = y_hi - y_lo if y_hi >= y_lo else 1.0
 
     # Avoid degenerate aspect ratios
     if width <= 0:
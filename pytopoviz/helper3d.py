@@ -17,7 +17,7 @@ def scale(factor: float) -> ProcessingFunction:
         mapper.z_scale_factor = mapper.z_scale_factor * self.factor
         return None
 
-    return ProcessorFactory.build(
+    proc = ProcessorFactory.build(
         "scale",
         process,
         recursive=True,
@@ -25,6 +25,9 @@ def scale(factor: float) -> ProcessingFunction:
         compatible_3d=True,
         factor=float(factor),
     )
+    # Lets expand_plottables fuse adjacent scales into one call.
+    proc._fusable_scale = True
+    return proc
 
 
 def double_scale() -> ProcessingFunction:
@@ -149,9 +152,7 @@ def lighting_intensity_up() -> ProcessingFunction:
     """Relative: increase lighting intensity by 20%."""
 
     def process(self: ProcessingFunction, mapper: MapObject):
-        mapper.ambient = mapper.ambient * 1.2
-        mapper.diffuse = mapper.diffuse * 1.2
-        mapper.specular = mapper.specular * 1.2
+        mapper._scale_lighting(1.2, 1.2, 1.2)
         return None
 
     return ProcessorFactory.build(
@@ -167,9 +168,7 @@ def lighting_intensity_down() -> ProcessingFunction:
     """Relative: decrease lighting intensity by 20%."""
 
     def process(self: ProcessingFunction, mapper: MapObject):
-        mapper.ambient = mapper.ambient * 0.8
-        mapper.diffuse = mapper.diffuse * 0.8
-        mapper.specular = mapper.specular * 0.8
+        mapper._scale_lighting(0.8, 0.8, 0.8)
         return None
 
     return ProcessorFactory.build(
@@ -185,8 +184,7 @@ def lighting_brighten() -> ProcessingFunction:
     """Relative: brighten by boosting ambient and diffuse."""
 
     def process(self: ProcessingFunction, mapper: MapObject):
-        mapper.ambient = mapper.ambient * 1.3
-        mapper.diffuse = mapper.diffuse * 1.15
+        mapper._scale_lighting(1.3, 1.15)
         return None
 
     return ProcessorFactory.build(
@@ -202,8 +200,7 @@ def lighting_darken() -> ProcessingFunction:
     """Relative: darken by reducing ambient and diffuse."""
 
     def process(self: ProcessingFunction, mapper: MapObject):
-        mapper.ambient = mapper.ambient * 0.7
-        mapper.diffuse = mapper.diffuse * 0.85
+        mapper._scale_lighting(0.7, 0.85)
         return None
 
     return ProcessorFactory.build(
@@ -3,73 +3,132 @@
 Author: B.G.
 """
 
-from functools import partial
-from typing import Iterable, Tuple, Union
+import copy
+from functools import lru_cache
+from typing import Iterable, Tuple
 
 import numpy as np
-from scipy.ndimage import gaussian_filter
 
 from topotoolbox import GridObject
 
+from ._kernels import (
+    fill_nonfinite,
+    finite_sum_count,
+    multishade_fused,
+    multishade_horn,
+    nan_finite_counts,
+    nan_where_nan,
+)
+from .filter2d import _nan_gaussian_filter
 from .map_object import MapObject
 
 __all__ = ["hillshade", "multishade", "smooth_hillshade", "smooth_multishade"]
 
+# Gradient schemes: "central" matches topotoolbox's hillshade, "horn" is the
+# 3x3 stencil used by GDAL.
+_SHADING_KERNELS = {
+    "central": multishade_fused,
+    "horn": multishade_horn,
+}
+
 
 def _nan_gaussian_smooth(values: np.ndarray, sigma: float, mode: str) -> np.ndarray:
     """Gaussian smooth while preserving NaNs."""
-    data = np.asarray(values, dtype=np.float32)
-    finite_mask = np.isfinite(data)
+    data = np.ascontiguousarray(values, dtype=np.float32)
+    tmp = np.empty_like(data)
+    weights = np.empty_like(data)
+    result = np.empty_like(data)
+    return _nan_gaussian_filter(data, sigma, mode, 4.0, tmp, weights, result)
+
+
+def _grid_with_data(grid: GridObject, data: np.ndarray) -> GridObject:
+    """Copy ``grid`` with ``data`` as its ``z``, without copying the old ``z``.
+
+    Same result as ``grid.duplicate_with_new_data(data)``, which deep-copies
+    the source raster and then copies ``data`` again; here ``data`` is adopted.
+    """
+    if data.shape != grid.z.shape:
+        raise ValueError("Both GridObjects have to be the same size.")
+    return copy.deepcopy(grid, {id(grid.z): data})
+
 
-    filled = np.where(finite_mask, data, 0.0)
-    smoothed_data = gaussian_filter(filled, sigma=sigma, mode=mode)
-    weights = gaussian_filter(finite_mask.astype(float), sigma=sigma, mode=mode)
+@lru_cache(maxsize=64)
+def _light_vectors(gt, azimuths: Tuple[float, ...], altitude: float) -> np.ndarray:
+    """Return one ``(lx, ly, lz)`` row per azimuth in image coordinates.
 
-    with np.errstate(invalid="ignore", divide="ignore"):
-        result = smoothed_data / weights
-    result[weights == 0.0] = np.nan
-    return result.astype(np.float32)
+    Azimuths are measured clockwise from north and converted to the image
+    frame through the grid geotransform ``gt`` (an ``affine.Affine``), as
+    topotoolbox does. Results are cached (read-only) so repeated shading with
+    the same lights skips the trigonometry.
+    """
+    gt = gt.translation(-gt.xoff, -gt.yoff) * gt
+    inv_gt = ~gt
+    alt = np.deg2rad(altitude)
+    lights = np.empty((len(azimuths), 3), dtype=np.float32)
+    for k, azimuth in enumerate(azimuths):
+        az = np.deg2rad(azimuth)
+        dx, dy = inv_gt * (np.sin(az), np.cos(az))
+        az_image = np.arctan2(dy, dx)
+        lights[k] = (
+            np.cos(az_image) * np.cos(alt),
+            np.sin(az_image) * np.cos(alt),
+            np.sin(alt),
+        )
+    lights.setflags(write=False)
+    return lights
 
 
 def _hillshade_from_values(
     mapper: MapObject,
     values: np.ndarray,
-    azimuth: float,
+    azimuths: Tuple[float, ...],
     altitude: float,
     exaggerate: float,
-    fused: bool,
     alpha: float,
+    gradient: str = "central",
 ) -> MapObject:
+    """Shade ``values`` on the mapper grid, averaging over ``azimuths``."""
+    try:
+        kernel = _SHADING_KERNELS[gradient]
+    except KeyError:
+        options = ", ".join(sorted(_SHADING_KERNELS))
+        raise ValueError(f"Unknown gradient '{gradient}'. Available: {options}") from None
     values = np.asarray(values, dtype=np.float32)
-    mask = np.isnan(values)
-    has_finite_values = np.isfinite(values).any()
-
-    grid_values = np.asarray(mapper.grid.z, dtype=np.float32)
-    finite_grid = np.isfinite(grid_values)
-    fallback_val = float(grid_values[finite_grid].mean()) if finite_grid.any() else 0.0
-
-    clean_values = np.where(np.isfinite(values), values, fallback_val)
-    temp_grid: GridObject = mapper.grid.duplicate_with_new_data(clean_values)
-
-    hs_grid: GridObject = temp_grid.hillshade(
-        azimuth=azimuth, altitude=altitude, exaggerate=exaggerate, fused=fused
+    # Read the source grid in its own dtype; only ``values`` is float32.
+    grid_values = np.asarray(mapper.grid.z)
+
+    # Clean grids are shaded straight from ``values``; otherwise non-finite
+    # cells are filled with the mean of the source grid in a working copy.
+    n_nan, n_finite = nan_finite_counts(values)
+    clean_values = values
+    if n_finite < values.size:
+        total, count = finite_sum_count(grid_values)
+        fallback_val = np.float32(total / count) if count else np.float32(0.0)
+        clean_values = np.empty(values.shape, dtype=np.float32)
+        fill_nonfinite(values, fallback_val, clean_values)
+
+    cellsize = float(mapper.grid.cellsize) if mapper.grid.cellsize else 1.0
+    if cellsize <= 0:
+        cellsize = 1.0
+    lights = _light_vectors(
+        mapper.grid.transform, tuple(float(az) for az in azimuths), float(altitude)
     )
+    shaded_values = np.empty(clean_values.shape, dtype=np.float32)
+    kernel(clean_values, float(exaggerate) / cellsize, lights, shaded_values)
 
-    shaded_values = np.array(hs_grid.z, copy=True)
-    if mask.any():
-        if has_finite_values:
-            shaded_values[mask] = np.nan
-        else:
-            base_mask = np.isnan(grid_values)
-            shaded_values[base_mask] = np.nan
+    if n_nan:
+        nan_where_nan(values if n_finite else grid_values, shaded_values)
 
+    # The shaded buffer is owned by the new grid, so the MapObject adopts it
+    # as its value instead of taking another float32 copy.
+    hs_grid = _grid_with_data(mapper.grid, shaded_values)
     result = MapObject(
         hs_grid,
         cmap='gray',
         alpha=alpha,
+        copy=False,
     )
     result.draped = True
-    result.value = shaded_values
     return result
 
 
@@ -80,19 +139,23 @@ def hillshade(
     exaggerate: float = 1.0,
     fused: bool = True,
     alpha: float = 0.45,
+    gradient: str = "central",
 ) -> MapObject:
     """Return a MapObject with the hillshade of the mapper's grid.
 
     NaN values from the source mapper are propagated to the hillshaded result.
+    ``fused`` is kept for API compatibility; shading always runs in the fused
+    Numba kernel. ``gradient`` selects the slope estimator: ``"central"``
+    (default, matches topotoolbox) or ``"horn"`` (3x3 stencil, as in GDAL).
     """
     return _hillshade_from_values(
         mapper,
         mapper.value,
-        azimuth=azimuth,
+        azimuths=(azimuth,),
         altitude=altitude,
         exaggerate=exaggerate,
-        fused=fused,
         alpha=alpha,
+        gradient=gradient,
     )
 
 
@@ -105,123 +168,73 @@ def smooth_hillshade(
     exaggerate: float = 1.0,
     fused: bool = True,
     alpha: float = 0.45,
+    gradient: str = "central",
 ) -> MapObject:
     """Return hillshade computed on a Gaussian-smoothed copy of mapper values."""
     smoothed = _nan_gaussian_smooth(mapper.value, sigma=sigma, mode=mode)
     return _hillshade_from_values(
         mapper,
         smoothed,
-        azimuth=azimuth,
+        azimuths=(azimuth,),
         altitude=altitude,
         exaggerate=exaggerate,
-        fused=fused,
         alpha=alpha,
+        gradient=gradient,
     )
 
 
 def multishade(
     mapper: MapObject,
-    azimuths: Union[Iterable[float], Tuple[float, float]] = (315.0, 135.0),
+    azimuths: Iterable[float] = (315.0, 135.0),
     altitude: float = 50.0,
     exaggerate: float = 1.0,
     fused: bool = True,
     alpha: float = 0.45,
+    gradient: str = "central",
 ) -> MapObject:
-    """Average two hillshades from different azimuths."""
+    """Average the hillshades from one or more azimuths.
+
+    All directions are shaded in a single fused pass over the grid, so four-
+    or eight-way shading costs no extra memory.
+    """
     azimuth_list = tuple(azimuths)
-    if len(azimuth_list) != 2:
-        raise ValueError("azimuths must contain exactly two angles.")
+    if not azimuth_list:
+        raise ValueError("azimuths must contain at least one angle.")
 
-    shade1 = hillshade(
-        mapper,
-        azimuth=azimuth_list[0],
-        altitude=altitude,
-        exaggerate=exaggerate,
-        fused=fused,
-    )
-    shade2 = hillshade(
+    return _hillshade_from_values(
         mapper,
-        azimuth=azimuth_list[1],
+        mapper.value,
+        azimuths=azimuth_list,
         altitude=altitude,
         exaggerate=exaggerate,
-        fused=fused,
-    )
-
-    stacked = np.stack([shade1.value, shade2.value])
-    valid_counts = np.isfinite(stacked).sum(axis=0)
-    summed = np.nansum(stacked, axis=0, dtype=np.float32)
-    averaged = np.divide(
-        summed,
-        valid_counts,
-        out=np.full_like(summed, np.nan, dtype=np.float32),
-        where=valid_counts > 0,
-    )
-
-    new_grid = mapper.grid.astype(np.float32)
-    new_grid.z = averaged.astype(np.float32)
-
-    result = MapObject(
-        new_grid,
-        cmap='gray',
         alpha=alpha,
+        gradient=gradient,
     )
-    result.draped = True
-    result.value = averaged
-    return result
 
 
 def smooth_multishade(
     mapper: MapObject,
-    azimuths: Union[Iterable[float], Tuple[float, float]] = (315.0, 135.0),
+    azimuths: Iterable[float] = (315.0, 135.0),
     sigma: float = 1.0,
     mode: str = "nearest",
     altitude: float = 50.0,
     exaggerate: float = 1.0,
     fused: bool = True,
     alpha: float = 0.45,
+    gradient: str = "central",
 ) -> MapObject:
-    """Average two hillshades computed on a Gaussian-smoothed copy."""
-    smoother = partial(smooth_hillshade, sigma=sigma, mode=mode)
-
+    """Average the hillshades of one or more azimuths on a Gaussian-smoothed copy."""
     azimuth_list = tuple(azimuths)
-    if len(azimuth_list) != 2:
-        raise ValueError("azimuths must contain exactly two angles.")
+    if not azimuth_list:
+        raise ValueError("azimuths must contain at least one angle.")
 
-    shade1 = smoother(
-        mapper,
-        azimuth=azimuth_list[0],
-        altitude=altitude,
-        exaggerate=exaggerate,
-        fused=fused,
-        alpha=alpha,
-    )
-    shade2 = smoother(
+    smoothed = _nan_gaussian_smooth(mapper.value, sigma=sigma, mode=mode)
+    return _hillshade_from_values(
         mapper,
-        azimuth=azimuth_list[1],
+        smoothed,
+        azimuths=azimuth_list,
         altitude=altitude,
         exaggerate=exaggerate,
-        fused=fused,
         alpha=alpha,
+        gradient=gradient,
     )
-
-    stacked = np.stack([shade1.value, shade2.value])
-    valid_counts = np.isfinite(stacked).sum(axis=0)
-    summed = np.nansum(stacked, axis=0, dtype=np.float32)
-    averaged = np.divide(
-        summed,
-        valid_counts,
-        out=np.full_like(summed, np.nan, dtype=np.float32),
-        where=valid_counts > 0,
-    )
-
-    new_grid = mapper.grid.astype(np.float32)
-    new_grid.z = averaged.astype(np.float32)
-
-    result = MapObject(
-        new_grid,
-        cmap='gray',
-        alpha=alpha,
-    )
-    result.draped = True
-    result.value = averaged
-    return result
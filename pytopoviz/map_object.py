@@ -14,10 +14,55 @@ from topotoolbox import GridObject
 
 __all__ = ["MapObject"]
 
+_NAME_ALPHABET = string.ascii_letters + string.digits
+_NAME_LENGTH = 8
+# All two-character strings over the alphabet, so names are spelled out
+# two characters per divmod.
+_NAME_PAIRS = tuple(a + b for a in _NAME_ALPHABET for b in _NAME_ALPHABET)
+
+
+def _fused_prepare_ok(arr: np.ndarray) -> bool:
+    """True when ``arr`` can go through the fused ``prepare_finite`` kernel."""
+    return arr.ndim == 2 and arr.dtype.kind in "fiu" and arr.dtype != np.float16
+
+
+def _prepare_buffer(arr: np.ndarray, copy: bool) -> np.ndarray:
+    """Output buffer for ``prepare_finite``; ``arr`` itself when it can be adopted."""
+    if not copy and arr.dtype == np.float32 and arr.flags.c_contiguous:
+        return arr
+    return np.empty(arr.shape, dtype=np.float32)
+
 
 class MapObject:
     """Store visualization defaults for a GridObject."""
 
+    # Fixed attribute layout: no per-instance __dict__.
+    __slots__ = (
+        "_grid",
+        "_cmap",
+        "_alpha",
+        "_cbar",
+        "_name",
+        "_hash",
+        "processors",
+        "_draped",
+        "_z_scale_factor",
+        "_ambient",
+        "_diffuse",
+        "_specular",
+        "_specular_power",
+        "_smooth_shading",
+        "_eye_dome_lighting",
+        "_light_azimuth",
+        "_light_elevation",
+        "_light_intensity",
+        "_extent",
+        "_value",
+        "_vmin",
+        "_vmax",
+        "_compatible_procs",
+    )
+
     def __init__(
         self,
         grid: GridObject,
@@ -38,6 +83,7 @@ class MapObject:
         light_azimuth: Optional[float] = None,
         light_elevation: Optional[float] = None,
         light_intensity: Optional[float] = None,
+        copy: bool = True,
     ) -> None:
         """
         Parameters
@@ -78,12 +124,17 @@ class MapObject:
             Scene light elevation override (degrees).
         light_intensity : float or None, optional
             Scene light intensity override.
+        copy : bool, optional
+            If False and ``grid.z`` is already C-contiguous float32, it is
+            adopted as the value buffer instead of copied, so processors then
+            modify ``grid.z`` in place. Defaults to True.
         """
         self._grid = grid
         self._cmap = cmap
         self._alpha = alpha
         self._cbar = cbar
         self._name = self._generate_name() if name is None else self._validate_name(name)
+        self._hash = hash(self._name)  # name is read-only
         self.processors: List = list(processors) if processors is not None else []
         self._draped = bool(draped)
         self._z_scale_factor = 1.0
@@ -97,26 +148,77 @@ class MapObject:
         self._light_elevation = light_elevation
         self._light_intensity = light_intensity
 
-        self._value = self._prepare_value(grid.z)
+        self._extent: Optional[tuple] = None
 
         if vmin is None or vmax is None:
-            auto_min, auto_max = self._nan_aware_minmax(self._value)
+            self._value, auto_min, auto_max = self._prepare_with_range(grid.z, copy=copy)
             self._vmin = auto_min if vmin is None else vmin
             self._vmax = auto_max if vmax is None else vmax
         else:
+            self._value = self._prepare_value(grid.z, copy=copy)
             self._vmin = vmin
             self._vmax = vmax
 
     @staticmethod
-    def _prepare_value(value: np.ndarray) -> np.ndarray:
-        """Return float32 array with non-finite entries as NaN."""
-        val = np.array(value, dtype=np.float32, copy=True)
-        val[~np.isfinite(val)] = np.nan
+    def _prepare_value(value: np.ndarray, copy: bool = True) -> np.ndarray:
+        """Return C-contiguous float32 array with non-finite entries as NaN.
+
+        This is the single point where values are cast to float32; processors
+        then work on (and may modify in place) the float32 buffer. With
+        ``copy=False`` an array that is already C-contiguous float32 is adopted
+        as is. Keeping the buffer C-ordered lets ``imshow`` and the Numba
+        kernels use it without another copy. Cast and masking happen in one
+        pass, without a boolean mask.
+        """
+        arr = np.asarray(value)
+        if _fused_prepare_ok(arr):
+            from ._kernels import prepare_finite  # local import keeps numba lazy
+
+            val = _prepare_buffer(arr, copy)
+            prepare_finite(arr, val)
+            return val
+        if copy:
+            val = np.array(arr, dtype=np.float32, order="C", copy=True)
+        else:
+            val = np.ascontiguousarray(arr, dtype=np.float32)
+        np.nan_to_num(val, copy=False, nan=np.nan, posinf=np.nan, neginf=np.nan)
         return val
 
+    @classmethod
+    def _prepare_with_range(
+        cls, value: np.ndarray, copy: bool = True
+    ) -> tuple[np.ndarray, float, float]:
+        """``_prepare_value`` plus ``_nan_aware_minmax`` of the result.
+
+        2D numeric input is cast, masked and reduced in a single parallel
+        pass; other input goes through the two separate steps.
+        """
+        arr = np.asarray(value)
+        if not _fused_prepare_ok(arr):
+            val = cls._prepare_value(arr, copy=copy)
+            return (val, *cls._nan_aware_minmax(val))
+
+        from ._kernels import prepare_finite  # local import keeps numba lazy
+
+        val = _prepare_buffer(arr, copy)
+        low, high = prepare_finite(arr, val)
+        if low > high:
+            return val, np.nan, np.nan
+        return val, float(low), float(high)
+
     @staticmethod
     def _nan_aware_minmax(arr: np.ndarray) -> tuple[float, float]:
-        """Return (min, max) ignoring NaNs; (nan, nan) if no finite values."""
+        """Return (min, max) ignoring NaNs; (nan, nan) if no finite values.
+
+        2D values are reduced in a single parallel pass.
+        """
+        if arr.ndim == 2:
+            from ._kernels import finite_minmax  # local import keeps numba lazy
+
+            low, high = finite_minmax(arr)
+            if low > high:
+                return np.nan, np.nan
+            return float(low), float(high)
         finite_mask = np.isfinite(arr)
         if finite_mask.any():
             return float(np.nanmin(arr)), float(np.nanmax(arr))
@@ -124,8 +226,14 @@ class MapObject:
 
     @staticmethod
     def _generate_name() -> str:
-        alphabet = string.ascii_letters + string.digits
-        return "".join(secrets.choice(alphabet) for _ in range(8))
+        # One draw from the OS RNG, spelled out in base 62**2.
+        base = len(_NAME_PAIRS)
+        number = secrets.randbelow(base ** (_NAME_LENGTH // 2))
+        pairs = []
+        for _ in range(_NAME_LENGTH // 2):
+            number, digit = divmod(number, base)
+            pairs.append(_NAME_PAIRS[digit])
+        return "".join(pairs)
 
     @staticmethod
     def _validate_name(name: str) -> str:
@@ -140,8 +248,16 @@ class MapObject:
     @grid.setter
     def grid(self, grid: GridObject) -> None:
         self._grid = grid
+        self._extent = None
         self.value = grid.z
 
+    @property
+    def extent(self) -> tuple:
+        """Grid extent ``(left, right, bottom, top)``, cached until ``grid`` is reassigned."""
+        if self._extent is None:
+            self._extent = tuple(self._grid.extent)
+        return self._extent
+
     @property
     def cmap(self) -> Union[str, Colormap]:
         return self._cmap
@@ -180,8 +296,11 @@ class MapObject:
 
     @value.setter
     def value(self, value: np.ndarray) -> None:
-        self._value = self._prepare_value(value)
-        self._vmin, self._vmax = self._nan_aware_minmax(self._value)
+        self._set_value(value)
+
+    def _set_value(self, value: np.ndarray, copy: bool = True) -> None:
+        """Store ``value``; ``copy=False`` adopts freshly allocated float32 results."""
+        self._value, self._vmin, self._vmax = self._prepare_with_range(value, copy=copy)
 
     @property
     def cbar(self) -> Optional[str]:
@@ -243,6 +362,12 @@ class MapObject:
     def specular_power(self, value: float) -> None:
         self._specular_power = max(0.0, float(value))
 
+    def _scale_lighting(self, ambient: float, diffuse: float, specular: float = 1.0) -> None:
+        """Multiply the ambient, diffuse and specular terms, clamped to [0, 1]."""
+        self._ambient = max(0.0, min(1.0, self._ambient * ambient))
+        self._diffuse = max(0.0, min(1.0, self._diffuse * diffuse))
+        self._specular = max(0.0, min(1.0, self._specular * specular))
+
     @property
     def smooth_shading(self) -> Optional[bool]:
         return self._smooth_shading
@@ -284,7 +409,7 @@ class MapObject:
         self._light_intensity = None if value is None else float(value)
 
     def __hash__(self) -> int:
-        return hash(self._name)
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, MapObject):
@@ -3,49 +3,105 @@
 Author: B.G.
 """
 
+from typing import Optional
+
 import numpy as np
 
+from ._kernels import (
+    nan_above_inplace,
+    nan_below_inplace,
+    nan_equal_inplace,
+    nan_thresholds_inplace,
+)
 from .processing import ProcessingFunction, ProcessorFactory
 from .map_object import MapObject
 
+_NAN32 = np.float32(np.nan)
+
+
+def _threshold32(value: Optional[float]) -> np.float32:
+    """float32 threshold for ``nan_thresholds_inplace``; NaN disables the test."""
+    return _NAN32 if value is None else np.float32(value)
+
+
+def _fusable(proc: ProcessingFunction, equal=None, below=None, above=None) -> ProcessingFunction:
+    """Mark ``proc`` as a scalar NaN filter that expand_plottables may fuse.
+
+    The marker names the attributes holding the ``equal``, ``below`` and
+    ``above`` thresholds; None for tests the processor does not apply.
+    """
+    proc._fusable_mask = (equal, below, above)
+    return proc
+
 
 def nan_equal(target: float) -> ProcessingFunction:
     """Return processor that masks values equal to ``target`` to NaN. Author: B.G."""
 
     def process(self: ProcessingFunction, mapper: MapObject):
-        mapper.value[mapper.value == self.target] = np.nan
+        nan_equal_inplace(mapper.value, np.float32(self.target))
         return None
 
-    return ProcessorFactory.build("nan_equal", process, recursive=True, target=target)
+    proc = ProcessorFactory.build("nan_equal", process, recursive=True, target=target)
+    return _fusable(proc, equal="target")
 
 
 def nan_below(threshold: float=0.) -> ProcessingFunction:
     """Return processor that masks values <= threshold to NaN. Author: B.G."""
 
     def process(self: ProcessingFunction, mapper: MapObject):
-        mapper.value[mapper.value <= self.threshold] = np.nan
+        nan_below_inplace(mapper.value, np.float32(self.threshold))
         return None
 
-    return ProcessorFactory.build("nan_below", process, recursive=True, threshold=threshold)
+    proc = ProcessorFactory.build("nan_below", process, recursive=True, threshold=threshold)
+    return _fusable(proc, below="threshold")
 
 
 def nan_above(threshold: float=0.) -> ProcessingFunction:
     """Return processor that masks values >= threshold to NaN. Author: B.G."""
 
     def process(self: ProcessingFunction, mapper: MapObject):
-        mapper.value[mapper.value >= self.threshold] = np.nan
+        nan_above_inplace(mapper.value, np.float32(self.threshold))
         return None
 
-    return ProcessorFactory.build("nan_above", process, recursive=True, threshold=threshold)
+    proc = ProcessorFactory.build("nan_above", process, recursive=True, threshold=threshold)
+    return _fusable(proc, above="threshold")
+
+
+def nan_filter(
+    equal: Optional[float] = None,
+    below: Optional[float] = None,
+    above: Optional[float] = None,
+) -> ProcessingFunction:
+    """Return processor that masks values == ``equal``, <= ``below`` or >= ``above``.
+
+    Same result as chaining ``nan_equal``, ``nan_below`` and ``nan_above``, in a
+    single pass over the values. Conditions left as None are skipped. Author: B.G.
+    """
+
+    def process(self: ProcessingFunction, mapper: MapObject):
+        nan_thresholds_inplace(
+            mapper.value,
+            _threshold32(self.equal),
+            _threshold32(self.below),
+            _threshold32(self.above),
+        )
+        return None
+
+    proc = ProcessorFactory.build(
+        "nan_filter", process, recursive=True, equal=equal, below=below, above=above
+    )
+    return _fusable(proc, equal="equal", below="below", above="above")
+
 
 def nan_mask(mask: np.ndarray) -> ProcessingFunction:
     """Return processor that masks values using a 2D boolean/int mask. Author: B.G."""
 
     def process(self: ProcessingFunction, mapper: MapObject):
-        mask_arr = np.asarray(self.mask)
+        # Boolean masks are used as is; other dtypes are converted once per call.
+        mask_arr = np.asarray(self.mask, dtype=bool)
         if mask_arr.shape != mapper.value.shape:
             raise ValueError("nan_mask expects a mask with the same shape as mapper values.")
-        mapper.value[mask_arr.astype(bool)] = np.nan
+        np.copyto(mapper.value, _NAN32, where=mask_arr)
         return None
 
     return ProcessorFactory.build("nan_mask", process, recursive=True, mask=mask)
@@ -55,5 +111,6 @@ BUILTIN_MASK_NAN = {
     "nan_equal": nan_equal,
     "nan_below": nan_below,
     "nan_above": nan_above,
+    "nan_filter": nan_filter,
     "nan_mask": nan_mask,
 }
@@ -4,7 +4,9 @@ Author: B.G.
 """
 
 from dataclasses import dataclass
-from typing import Callable, Iterable, Sequence
+from typing import Callable, Iterable, Iterator, Sequence
+
+import numpy as np
 
 from .map_object import MapObject
 
@@ -37,10 +39,23 @@ class ProcessingFunction:
     def __call__(self, mapper: MapObject):
         return self.apply(self, mapper)
 
-    def __post_init__(self) -> None:
-        # Keep string-keyed compatibility flags for easy getattr usage.
-        setattr(self, "2d_compatible", bool(self.compatible_2d))
-        setattr(self, "3d_compatible", bool(self.compatible_3d))
+
+def _compatibility_alias(field: str) -> property:
+    """Read/write view of a ``compatible_*`` field under another name."""
+
+    def fget(self: ProcessingFunction) -> bool:
+        return bool(getattr(self, field))
+
+    def fset(self: ProcessingFunction, value: bool) -> None:
+        setattr(self, field, bool(value))
+
+    return property(fget, fset)
+
+
+# Keep string-keyed compatibility flags for easy getattr usage. They are
+# defined once on the class and always reflect the dataclass fields.
+setattr(ProcessingFunction, "2d_compatible", _compatibility_alias("compatible_2d"))
+setattr(ProcessingFunction, "3d_compatible", _compatibility_alias("compatible_3d"))
 
 
 class ProcessorFactory:
@@ -79,11 +94,146 @@ def _processor_is_compatible(proc: ProcessingFunction, mode: str | None) -> bool
     if mode is None:
         return True
     if mode == "2d":
-        return bool(getattr(proc, "2d_compatible", proc.compatible_2d))
+        return bool(proc.compatible_2d)
     if mode == "3d":
-        return bool(getattr(proc, "3d_compatible", proc.compatible_3d))
+        return bool(proc.compatible_3d)
     raise ValueError("mode must be '2d', '3d', or None.")
 
+def _is_scale(proc: ProcessingFunction) -> bool:
+    """True for processors built by ``helper3d.scale`` (marked ``_fusable_scale``)."""
+    return getattr(proc, "_fusable_scale", False) and hasattr(proc, "factor")
+
+
+def _fuse_scale_runs(processors: list) -> list:
+    """Collapse runs of adjacent ``scale`` processors into one processor.
+
+    Only processors built by ``helper3d.scale`` are fused; a user processor
+    merely named "scale" runs as is. The fused processor reads the factors of
+    the original processors at call time, so editing ``factor`` on any of them
+    still takes effect.
+    """
+    fused: list = []
+    run: list = []
+
+    def flush() -> None:
+        if len(run) == 1:
+            fused.append(run[0])
+        elif run:
+
+            def process(self: ProcessingFunction, mapper: MapObject):
+                factor = mapper.z_scale_factor
+                for part in self.parts:
+                    factor *= part.factor
+                mapper.z_scale_factor = factor
+                return None
+
+            fused.append(
+                ProcessorFactory.build(
+                    "scale",
+                    process,
+                    recursive=all(part.recursive for part in run),
+                    compatible_2d=False,
+                    compatible_3d=True,
+                    parts=tuple(run),
+                )
+            )
+        run.clear()
+
+    for proc in processors:
+        if _is_scale(proc):
+            run.append(proc)
+            continue
+        flush()
+        fused.append(proc)
+    flush()
+    return fused
+
+
+def _is_threshold_mask(proc: ProcessingFunction) -> bool:
+    """True for scalar NaN filters built in ``masknan`` (marked ``_fusable_mask``)."""
+    attrs = getattr(proc, "_fusable_mask", None)
+    return attrs is not None and all(attr is None or hasattr(proc, attr) for attr in attrs)
+
+
+def _fuse_mask_runs(processors: list) -> list:
+    """Collapse runs of adjacent scalar NaN filters into one processor.
+
+    ``nan_equal``, ``nan_below``, ``nan_above`` and ``nan_filter`` commute (NaN
+    never satisfies a later test), so a run of them is applied as a single
+    ``nan_thresholds_inplace`` pass: the largest ``below``, the smallest
+    ``above`` and the first ``equal``, with any further ``equal`` targets
+    applied after. Thresholds are read from the original processors at call
+    time, so editing them still takes effect.
+    """
+    fused: list = []
+    run: list = []
+
+    def flush() -> None:
+        if len(run) == 1:
+            fused.append(run[0])
+        elif run:
+
+            def process(self: ProcessingFunction, mapper: MapObject):
+                from ._kernels import nan_equal_inplace, nan_thresholds_inplace
+                from .masknan import _NAN32, _threshold32
+
+                equals = []
+                below = above = _NAN32
+                for part in self.parts:
+                    equal, low, high = (
+                        _threshold32(getattr(part, attr) if attr else None)
+                        for attr in part._fusable_mask
+                    )
+                    if not np.isnan(equal):
+                        equals.append(equal)
+                    # fmax/fmin skip NaN, i.e. disabled, thresholds.
+                    below = np.fmax(below, low)
+                    above = np.fmin(above, high)
+                nan_thresholds_inplace(mapper.value, equals[0] if equals else _NAN32, below, above)
+                for target in equals[1:]:
+                    nan_equal_inplace(mapper.value, target)
+                return None
+
+            fused.append(
+                ProcessorFactory.build(
+                    "nan_filter",
+                    process,
+                    recursive=all(part.recursive for part in run),
+                    compatible_2d=all(part.compatible_2d for part in run),
+                    compatible_3d=all(part.compatible_3d for part in run),
+                    parts=tuple(run),
+                )
+            )
+        run.clear()
+
+    for proc in processors:
+        if _is_threshold_mask(proc):
+            run.append(proc)
+            continue
+        flush()
+        fused.append(proc)
+    flush()
+    return fused
+
+
+def _compatible_processors(mapper: MapObject, mode: str | None) -> list:
+    """Return the processors of ``mapper`` that run in ``mode``, with runs fused.
+
+    The fused list is cached per mode and rebuilt when the filtered chain changes.
+    """
+    chain = [proc for proc in mapper.processors if _processor_is_compatible(proc, mode)]
+    cache = getattr(mapper, "_compatible_procs", None)
+    if cache is None:
+        cache = mapper._compatible_procs = {}
+    cached = cache.get(mode)
+    if cached is not None:
+        cached_chain, compatible = cached
+        if len(cached_chain) == len(chain) and all(a is b for a, b in zip(cached_chain, chain)):
+            return compatible
+    compatible = _fuse_mask_runs(_fuse_scale_runs(chain))
+    cache[mode] = (tuple(chain), compatible)
+    return compatible
+
 def expand_plottables(mapper: MapObject, mode: str | None = None) -> list[MapObject]:
     """Apply processors in-order and collect plottables depth-first.
 
@@ -96,61 +246,98 @@ def expand_plottables(mapper: MapObject, mode: str | None = None) -> list[MapObj
     sequence the processors define.
     """
 
-    def walk(current: MapObject) -> list[MapObject]:
-        collected: list[MapObject] = [current]
-        for proc in current.processors:
-            if not _processor_is_compatible(proc, mode):
-                continue
+    def children(current: MapObject) -> Iterator[MapObject]:
+        # Lazy: the next processor of ``current`` only runs once the
+        # previously yielded child has been walked completely.
+        for proc in _compatible_processors(current, mode):
             produced = proc(current)
             if produced is None:
                 continue
             produced_list: Iterable = produced if isinstance(produced, (list, tuple)) else (produced,)
             for item in produced_list:
-                if not is_plottable(item):
-                    continue
-                collected.extend(walk(item))
-        return collected
+                if is_plottable(item):
+                    yield item
 
-    return walk(mapper)
+    # Iterative walk over a stack of child generators: one output list and
+    # no recursion limit on deep processor trees.
+    collected: list[MapObject] = [mapper]
+    stack = [children(mapper)]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            continue
+        collected.append(item)
+        stack.append(children(item))
+    return collected
+
+
+def expand_plottables_many(
+    mappers: Sequence[MapObject],
+    mode: str | None = None,
+) -> list[list[MapObject]]:
+    """Run ``expand_plottables`` for several MapObjects, in input order.
+
+    Pipelines run one after the other: the heavy kernels are already
+    parallel over rows, so a thread pool per call only adds overhead.
+    """
+    return [expand_plottables(mapper, mode=mode) for mapper in mappers]
 
 
 class _ProcessorNamespace:
-    """Namespace-style accessor for built-in processors grouped by module."""
-
-    def __init__(self):
-        from . import filter2d, helper3d, masknan, shading2d  # local import to avoid cycles
-
-        self.masknan = masknan
-        self.shading2d = shading2d
-        self.filter2d = filter2d
-        self.helper3d = helper3d
-        # Convenient top-level aliases
-        self.nan_equal = masknan.nan_equal
-        self.nan_below = masknan.nan_below
-        self.nan_above = masknan.nan_above
-        self.nan_mask = masknan.nan_mask
-        self.hillshade = shading2d.hillshade_processor
-        self.multishade = shading2d.multishade_processor
-        self.gaussian_smooth = filter2d.gaussian_smooth
-        self.scale = helper3d.scale
-        self.double_scale = helper3d.double_scale
-        self.halve_scale = helper3d.halve_scale
-        self.tenfold = helper3d.tenfold
-        self.tenthfold = helper3d.tenthfold
-        self.lighting_control = helper3d.lighting_control
-        self.matte_lighting = helper3d.matte_lighting
-        self.glossy_lighting = helper3d.glossy_lighting
-        self.flat_lighting = helper3d.flat_lighting
-        self.dramatic_lighting = helper3d.dramatic_lighting
-        self.heightmap_lighting = helper3d.heightmap_lighting
-        self.lighting_intensity_up = helper3d.lighting_intensity_up
-        self.lighting_intensity_down = helper3d.lighting_intensity_down
-        self.lighting_brighten = helper3d.lighting_brighten
-        self.lighting_darken = helper3d.lighting_darken
-        self.light_rotate_left = helper3d.light_rotate_left
-        self.light_rotate_right = helper3d.light_rotate_right
-        self.light_raise = helper3d.light_raise
-        self.light_lower = helper3d.light_lower
+    """Namespace-style accessor for built-in processors grouped by module.
+
+    Modules and aliases are imported on first access, so importing any
+    processor module first does not recurse back into itself.
+    """
+
+    _MODULES = ("masknan", "shading2d", "filter2d", "helper3d")
+    # Convenient top-level aliases: name -> (module, attribute)
+    _ALIASES = {
+        "nan_equal": ("masknan", "nan_equal"),
+        "nan_below": ("masknan", "nan_below"),
+        "nan_above": ("masknan", "nan_above"),
+        "nan_filter": ("masknan", "nan_filter"),
+        "nan_mask": ("masknan", "nan_mask"),
+        "hillshade": ("shading2d", "hillshade_processor"),
+        "multishade": ("shading2d", "multishade_processor"),
+        "gaussian_smooth": ("filter2d", "gaussian_smooth"),
+        "scale": ("helper3d", "scale"),
+        "double_scale": ("helper3d", "double_scale"),
+        "halve_scale": ("helper3d", "halve_scale"),
+        "tenfold": ("helper3d", "tenfold"),
+        "tenthfold": ("helper3d", "tenthfold"),
+        "lighting_control": ("helper3d", "lighting_control"),
+        "matte_lighting": ("helper3d", "matte_lighting"),
+        "glossy_lighting": ("helper3d", "glossy_lighting"),
+        "flat_lighting": ("helper3d", "flat_lighting"),
+        "dramatic_lighting": ("helper3d", "dramatic_lighting"),
+        "heightmap_lighting": ("helper3d", "heightmap_lighting"),
+        "lighting_intensity_up": ("helper3d", "lighting_intensity_up"),
+        "lighting_intensity_down": ("helper3d", "lighting_intensity_down"),
+        "lighting_brighten": ("helper3d", "lighting_brighten"),
+        "lighting_darken": ("helper3d", "lighting_darken"),
+        "light_rotate_left": ("helper3d", "light_rotate_left"),
+        "light_rotate_right": ("helper3d", "light_rotate_right"),
+        "light_raise": ("helper3d", "light_raise"),
+        "light_lower": ("helper3d", "light_lower"),
+    }
+
+    def __getattr__(self, name: str):
+        import importlib
+
+        if name in self._MODULES:
+            value = importlib.import_module(f".{name}", __package__)
+        elif name in self._ALIASES:
+            module_name, attr = self._ALIASES[name]
+            value = getattr(importlib.import_module(f".{module_name}", __package__), attr)
+        else:
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._MODULES) | set(self._ALIASES))
 
 
 # Expose a shared namespace instance
@@ -16,6 +16,7 @@ def hillshade_processor(
     exaggerate: float = 1.0,
     fused: bool = True,
     alpha: float = 0.45,
+    gradient: str = "central",
 ) -> ProcessingFunction:
     """Return processor generating a hillshade MapObject. Author: B.G."""
 
@@ -27,6 +28,7 @@ def hillshade_processor(
             exaggerate=self.exaggerate,
             fused=self.fused,
             alpha=self.alpha,
+            gradient=self.gradient,
         )
 
     return ProcessorFactory.build(
@@ -38,6 +40,7 @@ def hillshade_processor(
         exaggerate=exaggerate,
         fused=fused,
         alpha=alpha,
+        gradient=gradient,
     )
 
 
@@ -47,8 +50,9 @@ def multishade_processor(
     exaggerate: float = 1.0,
     fused: bool = True,
     alpha: float = 0.45,
+    gradient: str = "central",
 ) -> ProcessingFunction:
-    """Return processor generating averaged dual-azimuth hillshade. Author: B.G."""
+    """Return processor generating a hillshade averaged over ``azimuths``. Author: B.G."""
 
     def process(self: ProcessingFunction, mapper: MapObject):
         return multishade(
@@ -58,6 +62,7 @@ def multishade_processor(
             exaggerate=self.exaggerate,
             fused=self.fused,
             alpha=self.alpha,
+            gradient=self.gradient,
         )
 
     return ProcessorFactory.build(
@@ -69,6 +74,7 @@ def multishade_processor(
         exaggerate=exaggerate,
         fused=fused,
         alpha=alpha,
+        gradient=gradient,
     )
 
 
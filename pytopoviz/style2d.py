@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
 __all__ = [
     "apply_dark_pres_mono_style",
@@ -11,9 +14,161 @@ __all__ = [
     "apply_nothing_style",
     "set_style",
     "get_style",
+    "get_style_dict",
 ]
 
 _CURRENT_STYLE: "str | None" = None
+# Layout override of the last set_style call and the rcParams it left, as read
+# back right after applying it.
+_APPLIED_LAYOUT: "str | None" = None
+_APPLIED_RC: "dict | None" = None
+
+# set_style ``layout`` overrides.
+_LAYOUT_RC = {
+    "constrained": {"figure.constrained_layout.use": True, "figure.autolayout": False},
+    "tight": {"figure.constrained_layout.use": False, "figure.autolayout": True},
+    "none": {"figure.constrained_layout.use": False, "figure.autolayout": False},
+}
+
+
+@lru_cache(maxsize=1)
+def _preset_defaults() -> dict:
+    """Return matplotlib's default for every key set by any preset (cached)."""
+    import matplotlib as mpl
+
+    keys = set().union(*_PRESET_RCS) | {"axes.prop_cycle"}
+    return {key: mpl.rcParamsDefault[key] for key in keys}
+
+
+def _apply_preset(rc: Mapping[str, object], colors: "tuple[str, ...] | None" = None) -> None:
+    """Reset every key any preset touches to matplotlib's defaults, then apply ``rc``.
+
+    Switching presets therefore never leaks keys set only by the previous one.
+    """
+    import matplotlib.pyplot as plt
+
+    plt.rcParams.update(_preset_defaults())
+    plt.rcParams.update(rc)
+    if colors is not None:
+        from cycler import cycler
+
+        plt.rcParams["axes.prop_cycle"] = cycler(color=colors)
+
+
+# rcParams of each preset, applied by ``_apply_preset`` in one bulk update.
+# The tables are read-only so they can be shared without defensive copies.
+# The color cycles are kept apart so ``cycler`` is only imported on use.
+
+_DARK_PRES_MONO_RC = MappingProxyType(
+    {
+        "font.family": "monospace",
+        "font.monospace": (
+            "JetBrains Mono",
+            "Fira Mono",
+            "Consolas",
+            "Menlo",
+            "DejaVu Sans Mono",
+            "Courier New",
+        ),
+        "font.size": 15,
+        "text.color": "#e6e6e6",
+        "axes.labelcolor": "#ffffff",
+        "axes.labelweight": "bold",
+        "axes.unicode_minus": True,
+
+        "axes.titlesize": 24,
+        "axes.titleweight": "bold",
+        "axes.titlelocation": "left",
+        "axes.labelsize": 18,
+        "xtick.labelsize": 15,
+        "ytick.labelsize": 15,
+        "legend.fontsize": 14,
+
+        "figure.facecolor": "#0e1117",
+        "axes.facecolor": "#0e1117",
+        "savefig.facecolor": "#0e1117",
+        "figure.edgecolor": "#0e1117",
+        "figure.dpi": 160,
+        "savefig.dpi": 200,
+        "savefig.bbox": "tight",
+        "savefig.pad_inches": 0.05,
+
+        "axes.edgecolor": "#3a3f4b",
+        "axes.linewidth": 1.0,
+        "axes.spines.top": False,
+        "axes.spines.right": False,
+        "axes.spines.left": True,
+        "axes.spines.bottom": True,
+
+        "axes.grid": False,
+
+        "xtick.color": "#d8dee9",
+        "ytick.color": "#d8dee9",
+        "xtick.direction": "out",
+        "ytick.direction": "out",
+        "xtick.minor.visible": True,
+        "ytick.minor.visible": True,
+        "xtick.major.size": 6,
+        "ytick.major.size": 6,
+        "xtick.major.width": 1.2,
+        "ytick.major.width": 1.2,
+        "xtick.minor.size": 3.5,
+        "ytick.minor.size": 3.5,
+        "xtick.minor.width": 1.0,
+        "ytick.minor.width": 1.0,
+
+        "lines.linewidth": 2.6,
+        "lines.solid_capstyle": "round",
+        "lines.solid_joinstyle": "round",
+        "lines.antialiased": True,
+        "lines.markersize": 6,
+        "lines.markeredgewidth": 0.0,
+        "errorbar.capsize": 3,
+
+        "patch.edgecolor": "#0e1117",
+        "patch.force_edgecolor": False,
+
+        "image.cmap": "magma",
+        "image.interpolation": "antialiased",
+
+        "legend.frameon": False,
+        "legend.facecolor": "none",
+        "legend.edgecolor": "none",
+        "legend.fancybox": False,
+        "legend.framealpha": 0.0,
+        "legend.title_fontsize": 14,
+        "legend.handlelength": 2.0,
+        "legend.handletextpad": 0.6,
+        "legend.borderaxespad": 0.8,
+
+        "boxplot.flierprops.marker": "o",
+        "boxplot.flierprops.markerfacecolor": "#f72585",
+        "boxplot.flierprops.markeredgecolor": "#0e1117",
+        "boxplot.whiskerprops.linestyle": "-",
+
+        "figure.autolayout": False,
+        "figure.constrained_layout.use": True,
+        "figure.constrained_layout.h_pad": 0.02,
+        "figure.constrained_layout.w_pad": 0.02,
+
+        "mathtext.default": "regular",
+        "pdf.fonttype": 42,
+        "ps.fonttype": 42,
+    }
+)
+
+_DARK_PRES_MONO_COLORS = (
+    "#4cc9f0",
+    "#f72585",
+    "#bde03f",
+    "#fca311",
+    "#9b5de5",
+    "#00f5d4",
+    "#ffd166",
+    "#e76f51",
+    "#56cfe1",
+    "#ff006e",
+)
 
 
 def apply_dark_pres_mono_style() -> None:
@@ -22,117 +177,117 @@ def apply_dark_pres_mono_style() -> None:
 
     Sets rcParams for a dark theme with monospace fonts.
     """
-    import matplotlib.pyplot as plt
-    from cycler import cycler
-
-    plt.rcParams["font.family"] = "monospace"
-    plt.rcParams["font.monospace"] = [
-        "JetBrains Mono",
-        "Fira Mono",
-        "Consolas",
-        "Menlo",
-        "DejaVu Sans Mono",
-        "Courier New",
-    ]
-    plt.rcParams["font.size"] = 15
-    plt.rcParams["text.color"] = "#e6e6e6"
-    plt.rcParams["axes.labelcolor"] = "#ffffff"
-    plt.rcParams["axes.labelweight"] = "bold"
-    plt.rcParams["axes.unicode_minus"] = True
-
-    plt.rcParams["axes.titlesize"] = 24
-    plt.rcParams["axes.titleweight"] = "bold"
-    plt.rcParams["axes.titlelocation"] = "left"
-    plt.rcParams["axes.labelsize"] = 18
-    plt.rcParams["xtick.labelsize"] = 15
-    plt.rcParams["ytick.labelsize"] = 15
-    plt.rcParams["legend.fontsize"] = 14
-
-    plt.rcParams["figure.facecolor"] = "#0e1117"
-    plt.rcParams["axes.facecolor"] = "#0e1117"
-    plt.rcParams["savefig.facecolor"] = "#0e1117"
-    plt.rcParams["figure.edgecolor"] = "#0e1117"
-    plt.rcParams["figure.dpi"] = 160
-    plt.rcParams["savefig.dpi"] = 200
-    plt.rcParams["savefig.bbox"] = "tight"
-    plt.rcParams["savefig.pad_inches"] = 0.05
-
-    plt.rcParams["axes.edgecolor"] = "#3a3f4b"
-    plt.rcParams["axes.linewidth"] = 1.0
-    plt.rcParams["axes.spines.top"] = False
-    plt.rcParams["axes.spines.right"] = False
-    plt.rcParams["axes.spines.left"] = True
-    plt.rcParams["axes.spines.bottom"] = True
-
-    plt.rcParams["axes.grid"] = False
-
-    plt.rcParams["xtick.color"] = "#d8dee9"
-    plt.rcParams["ytick.color"] = "#d8dee9"
-    plt.rcParams["xtick.direction"] = "out"
-    plt.rcParams["ytick.direction"] = "out"
-    plt.rcParams["xtick.minor.visible"] = True
-    plt.rcParams["ytick.minor.visible"] = True
-    plt.rcParams["xtick.major.size"] = 6
-    plt.rcParams["ytick.major.size"] = 6
-    plt.rcParams["xtick.major.width"] = 1.2
-    plt.rcParams["ytick.major.width"] = 1.2
-    plt.rcParams["xtick.minor.size"] = 3.5
-    plt.rcParams["ytick.minor.size"] = 3.5
-    plt.rcParams["xtick.minor.width"] = 1.0
-    plt.rcParams["ytick.minor.width"] = 1.0
-
-    plt.rcParams["lines.linewidth"] = 2.6
-    plt.rcParams["lines.solid_capstyle"] = "round"
-    plt.rcParams["lines.solid_joinstyle"] = "round"
-    plt.rcParams["lines.antialiased"] = True
-    plt.rcParams["lines.markersize"] = 6
-    plt.rcParams["lines.markeredgewidth"] = 0.0
-    plt.rcParams["errorbar.capsize"] = 3
-
-    plt.rcParams["patch.edgecolor"] = "#0e1117"
-    plt.rcParams["patch.force_edgecolor"] = False
-
-    plt.rcParams["image.cmap"] = "magma"
-    plt.rcParams["image.interpolation"] = "antialiased"
-
-    plt.rcParams["axes.prop_cycle"] = cycler(
-        color=[
-            "#4cc9f0",
-            "#f72585",
-            "#bde03f",
-            "#fca311",
-            "#9b5de5",
-            "#00f5d4",
-            "#ffd166",
-            "#e76f51",
-            "#56cfe1",
-            "#ff006e",
-        ]
-    )
-
-    plt.rcParams["legend.frameon"] = False
-    plt.rcParams["legend.facecolor"] = "none"
-    plt.rcParams["legend.edgecolor"] = "none"
-    plt.rcParams["legend.fancybox"] = False
-    plt.rcParams["legend.framealpha"] = 0.0
-    plt.rcParams["legend.title_fontsize"] = 14
-    plt.rcParams["legend.handlelength"] = 2.0
-    plt.rcParams["legend.handletextpad"] = 0.6
-    plt.rcParams["legend.borderaxespad"] = 0.8
-
-    plt.rcParams["boxplot.flierprops.marker"] = "o"
-    plt.rcParams["boxplot.flierprops.markerfacecolor"] = "#f72585"
-    plt.rcParams["boxplot.flierprops.markeredgecolor"] = "#0e1117"
-    plt.rcParams["boxplot.whiskerprops.linestyle"] = "-"
-
-    plt.rcParams["figure.autolayout"] = False
-    plt.rcParams["figure.constrained_layout.use"] = True
-    plt.rcParams["figure.constrained_layout.h_pad"] = 0.02
-    plt.rcParams["figure.constrained_layout.w_pad"] = 0.02
-
-    plt.rcParams["mathtext.default"] = "regular"
-    plt.rcParams["pdf.fonttype"] = 42
-    plt.rcParams["ps.fonttype"] = 42
+    _apply_preset(_DARK_PRES_MONO_RC, _DARK_PRES_MONO_COLORS)
+
+
+_PAPER_RC = MappingProxyType(
+    {
+        "font.family": "sans-serif",
+        "font.sans-serif": (
+            "Arial",
+            "Helvetica",
+            "DejaVu Sans",
+            "Liberation Sans",
+        ),
+        "font.size": 12,
+        "text.color": "#000000",
+        "axes.labelcolor": "#000000",
+        "axes.labelweight": "bold",
+        "axes.unicode_minus": True,
+
+        "axes.titlesize": 14,
+        "axes.titleweight": "bold",
+        "axes.titlelocation": "center",
+        "axes.labelsize": 13,
+        "xtick.labelsize": 11,
+        "ytick.labelsize": 11,
+        "legend.fontsize": 11,
+
+        "figure.facecolor": "#ffffff",
+        "axes.facecolor": "#ffffff",
+        "savefig.facecolor": "#ffffff",
+        "figure.edgecolor": "#ffffff",
+        "figure.dpi": 100,
+        "savefig.dpi": 300,
+        "savefig.bbox": "tight",
+        "savefig.pad_inches": 0.05,
+
+        "axes.edgecolor": "#000000",
+        "axes.linewidth": 0.8,
+        "axes.spines.top": False,
+        "axes.spines.right": False,
+        "axes.spines.left": True,
+        "axes.spines.bottom": True,
+
+        "axes.grid": False,
+
+        "xtick.color": "#000000",
+        "ytick.color": "#000000",
+        "xtick.direction": "out",
+        "ytick.direction": "out",
+        "xtick.minor.visible": True,
+        "ytick.minor.visible": True,
+        "xtick.major.size": 4,
+        "ytick.major.size": 4,
+        "xtick.major.width": 0.8,
+        "ytick.major.width": 0.8,
+        "xtick.minor.size": 2.5,
+        "ytick.minor.size": 2.5,
+        "xtick.minor.width": 0.6,
+        "ytick.minor.width": 0.6,
+
+        "lines.linewidth": 1.5,
+        "lines.solid_capstyle": "round",
+        "lines.solid_joinstyle": "round",
+        "lines.antialiased": True,
+        "lines.markersize": 4,
+        "lines.markeredgewidth": 0.5,
+        "errorbar.capsize": 2,
+
+        "patch.edgecolor": "#000000",
+        "patch.force_edgecolor": False,
+
+        "image.cmap": "viridis",
+        "image.interpolation": "antialiased",
+
+        "legend.frameon": True,
+        "legend.facecolor": "#ffffff",
+        "legend.edgecolor": "#000000",
+        "legend.fancybox": False,
+        "legend.framealpha": 1.0,
+        "legend.title_fontsize": 10,
+        "legend.handlelength": 2.0,
+        "legend.handletextpad": 0.5,
+        "legend.borderaxespad": 0.5,
+
+        "boxplot.flierprops.marker": "o",
+        "boxplot.flierprops.markerfacecolor": "#000000",
+        "boxplot.flierprops.markeredgecolor": "#000000",
+        "boxplot.whiskerprops.linestyle": "-",
+
+        "figure.autolayout": False,
+        "figure.constrained_layout.use": True,
+        "figure.constrained_layout.h_pad": 0.04,
+        "figure.constrained_layout.w_pad": 0.04,
+
+        "mathtext.default": "regular",
+        "pdf.fonttype": 42,
+        "ps.fonttype": 42,
+    }
+)
+
+_PAPER_COLORS = (
+    "#0173B2",
+    "#DE8F05",
+    "#029E73",
+    "#CC78BC",
+    "#CA9161",
+    "#949494",
+    "#ECE133",
+    "#56B4E9",
+    "#F0E442",
+    "#D55E00",
+)
 
 
 def apply_paper_style() -> None:
@@ -141,115 +296,122 @@ def apply_paper_style() -> None:
 
     Sets rcParams for a light theme with professional fonts.
     """
-    import matplotlib.pyplot as plt
-    from cycler import cycler
-
-    plt.rcParams["font.family"] = "sans-serif"
-    plt.rcParams["font.sans-serif"] = [
-        "Arial",
-        "Helvetica",
-        "DejaVu Sans",
-        "Liberation Sans",
-    ]
-    plt.rcParams["font.size"] = 12
-    plt.rcParams["text.color"] = "#000000"
-    plt.rcParams["axes.labelcolor"] = "#000000"
-    plt.rcParams["axes.labelweight"] = "bold"
-    plt.rcParams["axes.unicode_minus"] = True
-
-    plt.rcParams["axes.titlesize"] = 14
-    plt.rcParams["axes.titleweight"] = "bold"
-    plt.rcParams["axes.titlelocation"] = "center"
-    plt.rcParams["axes.labelsize"] = 13
-    plt.rcParams["xtick.labelsize"] = 11
-    plt.rcParams["ytick.labelsize"] = 11
-    plt.rcParams["legend.fontsize"] = 11
-
-    plt.rcParams["figure.facecolor"] = "#ffffff"
-    plt.rcParams["axes.facecolor"] = "#ffffff"
-    plt.rcParams["savefig.facecolor"] = "#ffffff"
-    plt.rcParams["figure.edgecolor"] = "#ffffff"
-    plt.rcParams["figure.dpi"] = 100
-    plt.rcParams["savefig.dpi"] = 300
-    plt.rcParams["savefig.bbox"] = "tight"
-    plt.rcParams["savefig.pad_inches"] = 0.05
-
-    plt.rcParams["axes.edgecolor"] = "#000000"
-    plt.rcParams["axes.linewidth"] = 0.8
-    plt.rcParams["axes.spines.top"] = False
-    plt.rcParams["axes.spines.right"] = False
-    plt.rcParams["axes.spines.left"] = True
-    plt.rcParams["axes.spines.bottom"] = True
-
-    plt.rcParams["axes.grid"] = False
-
-    plt.rcParams["xtick.color"] = "#000000"
-    plt.rcParams["ytick.color"] = "#000000"
-    plt.rcParams["xtick.direction"] = "out"
-    plt.rcParams["ytick.direction"] = "out"
-    plt.rcParams["xtick.minor.visible"] = True
-    plt.rcParams["ytick.minor.visible"] = True
-    plt.rcParams["xtick.major.size"] = 4
-    plt.rcParams["ytick.major.size"] = 4
-    plt.rcParams["xtick.major.width"] = 0.8
-    plt.rcParams["ytick.major.width"] = 0.8
-    plt.rcParams["xtick.minor.size"] = 2.5
-    plt.rcParams["ytick.minor.size"] = 2.5
-    plt.rcParams["xtick.minor.width"] = 0.6
-    plt.rcParams["ytick.minor.width"] = 0.6
-
-    plt.rcParams["lines.linewidth"] = 1.5
-    plt.rcParams["lines.solid_capstyle"] = "round"
-    plt.rcParams["lines.solid_joinstyle"] = "round"
-    plt.rcParams["lines.antialiased"] = True
-    plt.rcParams["lines.markersize"] = 4
-    plt.rcParams["lines.markeredgewidth"] = 0.5
-    plt.rcParams["errorbar.capsize"] = 2
-
-    plt.rcParams["patch.edgecolor"] = "#000000"
-    plt.rcParams["patch.force_edgecolor"] = False
-
-    plt.rcParams["image.cmap"] = "viridis"
-    plt.rcParams["image.interpolation"] = "antialiased"
-
-    plt.rcParams["axes.prop_cycle"] = cycler(
-        color=[
-            "#0173B2",
-            "#DE8F05",
-            "#029E73",
-            "#CC78BC",
-            "#CA9161",
-            "#949494",
-            "#ECE133",
-            "#56B4E9",
-            "#F0E442",
-            "#D55E00",
-        ]
-    )
-
-    plt.rcParams["legend.frameon"] = True
-    plt.rcParams["legend.facecolor"] = "#ffffff"
-    plt.rcParams["legend.edgecolor"] = "#000000"
-    plt.rcParams["legend.fancybox"] = False
-    plt.rcParams["legend.framealpha"] = 1.0
-    plt.rcParams["legend.title_fontsize"] = 10
-    plt.rcParams["legend.handlelength"] = 2.0
-    plt.rcParams["legend.handletextpad"] = 0.5
-    plt.rcParams["legend.borderaxespad"] = 0.5
-
-    plt.rcParams["boxplot.flierprops.marker"] = "o"
-    plt.rcParams["boxplot.flierprops.markerfacecolor"] = "#000000"
-    plt.rcParams["boxplot.flierprops.markeredgecolor"] = "#000000"
-    plt.rcParams["boxplot.whiskerprops.linestyle"] = "-"
-
-    plt.rcParams["figure.autolayout"] = False
-    plt.rcParams["figure.constrained_layout.use"] = True
-    plt.rcParams["figure.constrained_layout.h_pad"] = 0.04
-    plt.rcParams["figure.constrained_layout.w_pad"] = 0.04
-
-    plt.rcParams["mathtext.default"] = "regular"
-    plt.rcParams["pdf.fonttype"] = 42
-    plt.rcParams["ps.fonttype"] = 42
+    _apply_preset(_PAPER_RC, _PAPER_COLORS)
+
+
+_COLOR_PRES_RC = MappingProxyType(
+    {
+        "font.family": "sans-serif",
+        "font.sans-serif": (
+            "Inter",
+            "Arial",
+            "Helvetica",
+            "DejaVu Sans",
+            "Liberation Sans",
+        ),
+        "font.size": 15,
+        "text.color": "#0b0f1a",
+        "axes.labelcolor": "#0b0f1a",
+        "axes.labelweight": "bold",
+        "axes.unicode_minus": True,
+
+        "axes.titlesize": 24,
+        "axes.titleweight": "bold",
+        "axes.titlelocation": "left",
+        "axes.labelsize": 18,
+        "xtick.labelsize": 15,
+        "ytick.labelsize": 15,
+        "legend.fontsize": 14,
+
+        "figure.facecolor": "#f6f7fb",
+        "axes.facecolor": "#f6f7fb",
+        "savefig.facecolor": "#f6f7fb",
+        "figure.edgecolor": "#f6f7fb",
+        "figure.dpi": 140,
+        "savefig.dpi": 220,
+        "savefig.bbox": "tight",
+        "savefig.pad_inches": 0.05,
+
+        "axes.edgecolor": "#b7c0d8",
+        "axes.linewidth": 1.0,
+        "axes.spines.top": False,
+        "axes.spines.right": False,
+        "axes.spines.left": True,
+        "axes.spines.bottom": True,
+
+        "axes.grid": True,
+        "grid.color": "#d8deed",
+        "grid.linewidth": 0.8,
+        "grid.alpha": 0.8,
+        "grid.linestyle": "-",
+
+        "xtick.color": "#0b0f1a",
+        "ytick.color": "#0b0f1a",
+        "xtick.direction": "out",
+        "ytick.direction": "out",
+        "xtick.minor.visible": True,
+        "ytick.minor.visible": True,
+        "xtick.major.size": 6,
+        "ytick.major.size": 6,
+        "xtick.major.width": 1.0,
+        "ytick.major.width": 1.0,
+        "xtick.minor.size": 3,
+        "ytick.minor.size": 3,
+        "xtick.minor.width": 0.8,
+        "ytick.minor.width": 0.8,
+
+        "lines.linewidth": 2.4,
+        "lines.solid_capstyle": "round",
+        "lines.solid_joinstyle": "round",
+        "lines.antialiased": True,
+        "lines.markersize": 7,
+        "lines.markeredgewidth": 0.0,
+        "errorbar.capsize": 3,
+
+        "patch.edgecolor": "#0b0f1a",
+        "patch.force_edgecolor": False,
+
+        "image.cmap": "turbo",
+        "image.interpolation": "antialiased",
+
+        "legend.frameon": False,
+        "legend.facecolor": "none",
+        "legend.edgecolor": "none",
+        "legend.fancybox": False,
+        "legend.framealpha": 0.0,
+        "legend.title_fontsize": 14,
+        "legend.handlelength": 2.0,
+        "legend.handletextpad": 0.6,
+        "legend.borderaxespad": 0.8,
+
+        "boxplot.flierprops.marker": "o",
+        "boxplot.flierprops.markerfacecolor": "#ff3366",
+        "boxplot.flierprops.markeredgecolor": "#0b0f1a",
+        "boxplot.whiskerprops.linestyle": "-",
+
+        "figure.autolayout": False,
+        "figure.constrained_layout.use": True,
+        "figure.constrained_layout.h_pad": 0.04,
+        "figure.constrained_layout.w_pad": 0.04,
+
+        "mathtext.default": "regular",
+        "pdf.fonttype": 42,
+        "ps.fonttype": 42,
+    }
+)
+
+_COLOR_PRES_COLORS = (
+    "#0066ff",
+    "#ff3366",
+    "#00b386",
+    "#ffb000",
+    "#7a4fff",
+    "#ff6f00",
+    "#0096c7",
+    "#d7263d",
+    "#38b000",
+    "#f9844a",
+)
 
 
 def apply_color_pres_style() -> None:
@@ -258,227 +420,151 @@ def apply_color_pres_style() -> None:
 
     Uses a bright background with saturated accents for projection-friendly slides.
     """
-    import matplotlib.pyplot as plt
-    from cycler import cycler
+    _apply_preset(_COLOR_PRES_RC, _COLOR_PRES_COLORS)
+
+
+_BW_PAPER_RC = MappingProxyType(
+    {
+        "font.family": "serif",
+        "font.serif": (
+            "Times New Roman",
+            "Georgia",
+            "DejaVu Serif",
+            "Liberation Serif",
+        ),
+        "font.size": 11,
+        "text.color": "#000000",
+        "axes.labelcolor": "#000000",
+        "axes.labelweight": "normal",
+        "axes.unicode_minus": True,
+
+        "axes.titlesize": 13,
+        "axes.titleweight": "bold",
+        "axes.titlelocation": "center",
+        "axes.labelsize": 12,
+        "xtick.labelsize": 10,
+        "ytick.labelsize": 10,
+        "legend.fontsize": 10,
+
+        "figure.facecolor": "#ffffff",
+        "axes.facecolor": "#ffffff",
+        "savefig.facecolor": "#ffffff",
+        "figure.edgecolor": "#ffffff",
+        "figure.dpi": 100,
+        "savefig.dpi": 300,
+        "savefig.bbox": "tight",
+        "savefig.pad_inches": 0.05,
+
+        "axes.edgecolor": "#000000",
+        "axes.linewidth": 0.8,
+        "axes.spines.top": True,
+        "axes.spines.right": True,
+        "axes.spines.left": True,
+        "axes.spines.bottom": True,
+
+        "axes.grid": True,
+        "grid.color": "#cccccc",
+        "grid.linewidth": 0.6,
+        "grid.alpha": 0.8,
+        "grid.linestyle": "--",
+
+        "xtick.color": "#000000",
+        "ytick.color": "#000000",
+        "xtick.direction": "out",
+        "ytick.direction": "out",
+        "xtick.minor.visible": True,
+        "ytick.minor.visible": True,
+        "xtick.major.size": 4,
+        "ytick.major.size": 4,
+        "xtick.major.width": 0.8,
+        "ytick.major.width": 0.8,
+        "xtick.minor.size": 2,
+        "ytick.minor.size": 2,
+        "xtick.minor.width": 0.6,
+        "ytick.minor.width": 0.6,
+
+        "lines.linewidth": 1.4,
+        "lines.solid_capstyle": "butt",
+        "lines.solid_joinstyle": "miter",
+        "lines.antialiased": True,
+        "lines.markersize": 4,
+        "lines.markeredgewidth": 0.6,
+        "errorbar.capsize": 2,
+
+        "patch.edgecolor": "#000000",
+        "patch.force_edgecolor": True,
+
+        "image.cmap": "Greys",
+        "image.interpolation": "nearest",
+
+        "legend.frameon": True,
+        "legend.facecolor": "#ffffff",
+        "legend.edgecolor": "#000000",
+        "legend.fancybox": False,
+        "legend.framealpha": 1.0,
+        "legend.title_fontsize": 10,
+        "legend.handlelength": 1.6,
+        "legend.handletextpad": 0.4,
+        "legend.borderaxespad": 0.4,
+
+        "boxplot.flierprops.marker": "o",
+        "boxplot.flierprops.markerfacecolor": "#888888",
+        "boxplot.flierprops.markeredgecolor": "#000000",
+        "boxplot.whiskerprops.linestyle": "-",
+
+        "figure.autolayout": False,
+        "figure.constrained_layout.use": True,
+        "figure.constrained_layout.h_pad": 0.02,
+        "figure.constrained_layout.w_pad": 0.02,
+
+        "mathtext.default": "regular",
+        "pdf.fonttype": 42,
+        "ps.fonttype": 42,
+    }
+)
 
-    plt.rcParams["font.family"] = "sans-serif"
-    plt.rcParams["font.sans-serif"] = [
-        "Inter",
-        "Arial",
-        "Helvetica",
-        "DejaVu Sans",
-        "Liberation Sans",
-    ]
-    plt.rcParams["font.size"] = 15
-    plt.rcParams["text.color"] = "#0b0f1a"
-    plt.rcParams["axes.labelcolor"] = "#0b0f1a"
-    plt.rcParams["axes.labelweight"] = "bold"
-    plt.rcParams["axes.unicode_minus"] = True
-
-    plt.rcParams["axes.titlesize"] = 24
-    plt.rcParams["axes.titleweight"] = "bold"
-    plt.rcParams["axes.titlelocation"] = "left"
-    plt.rcParams["axes.labelsize"] = 18
-    plt.rcParams["xtick.labelsize"] = 15
-    plt.rcParams["ytick.labelsize"] = 15
-    plt.rcParams["legend.fontsize"] = 14
-
-    plt.rcParams["figure.facecolor"] = "#f6f7fb"
-    plt.rcParams["axes.facecolor"] = "#f6f7fb"
-    plt.rcParams["savefig.facecolor"] = "#f6f7fb"
-    plt.rcParams["figure.edgecolor"] = "#f6f7fb"
-    plt.rcParams["figure.dpi"] = 140
-    plt.rcParams["savefig.dpi"] = 220
-    plt.rcParams["savefig.bbox"] = "tight"
-    plt.rcParams["savefig.pad_inches"] = 0.05
-
-    plt.rcParams["axes.edgecolor"] = "#b7c0d8"
-    plt.rcParams["axes.linewidth"] = 1.0
-    plt.rcParams["axes.spines.top"] = False
-    plt.rcParams["axes.spines.right"] = False
-    plt.rcParams["axes.spines.left"] = True
-    plt.rcParams["axes.spines.bottom"] = True
-
-    plt.rcParams["axes.grid"] = True
-    plt.rcParams["grid.color"] = "#d8deed"
-    plt.rcParams["grid.linewidth"] = 0.8
-    plt.rcParams["grid.alpha"] = 0.8
-    plt.rcParams["grid.linestyle"] = "-"
-
-    plt.rcParams["xtick.color"] = "#0b0f1a"
-    plt.rcParams["ytick.color"] = "#0b0f1a"
-    plt.rcParams["xtick.direction"] = "out"
-    plt.rcParams["ytick.direction"] = "out"
-    plt.rcParams["xtick.minor.visible"] = True
-    plt.rcParams["ytick.minor.visible"] = True
-    plt.rcParams["xtick.major.size"] = 6
-    plt.rcParams["ytick.major.size"] = 6
-    plt.rcParams["xtick.major.width"] = 1.0
-    plt.rcParams["ytick.major.width"] = 1.0
-    plt.rcParams["xtick.minor.size"] = 3
-    plt.rcParams["ytick.minor.size"] = 3
-    plt.rcParams["xtick.minor.width"] = 0.8
-    plt.rcParams["ytick.minor.width"] = 0.8
-
-    plt.rcParams["lines.linewidth"] = 2.4
-    plt.rcParams["lines.solid_capstyle"] = "round"
-    plt.rcParams["lines.solid_joinstyle"] = "round"
-    plt.rcParams["lines.antialiased"] = True
-    plt.rcParams["lines.markersize"] = 7
-    plt.rcParams["lines.markeredgewidth"] = 0.0
-    plt.rcParams["errorbar.capsize"] = 3
-
-    plt.rcParams["patch.edgecolor"] = "#0b0f1a"
-    plt.rcParams["patch.force_edgecolor"] = False
-
-    # Use a widely available, vivid colormap to avoid dependency issues.
-    plt.rcParams["image.cmap"] = "turbo"
-    plt.rcParams["image.interpolation"] = "antialiased"
-
-    plt.rcParams["axes.prop_cycle"] = cycler(
-        color=[
-            "#0066ff",
-            "#ff3366",
-            "#00b386",
-            "#ffb000",
-            "#7a4fff",
-            "#ff6f00",
-            "#0096c7",
-            "#d7263d",
-            "#38b000",
-            "#f9844a",
-        ]
-    )
-
-    plt.rcParams["legend.frameon"] = False
-    plt.rcParams["legend.facecolor"] = "none"
-    plt.rcParams["legend.edgecolor"] = "none"
-    plt.rcParams["legend.fancybox"] = False
-    plt.rcParams["legend.framealpha"] = 0.0
-    plt.rcParams["legend.title_fontsize"] = 14
-    plt.rcParams["legend.handlelength"] = 2.0
-    plt.rcParams["legend.handletextpad"] = 0.6
-    plt.rcParams["legend.borderaxespad"] = 0.8
-
-    plt.rcParams["boxplot.flierprops.marker"] = "o"
-    plt.rcParams["boxplot.flierprops.markerfacecolor"] = "#ff3366"
-    plt.rcParams["boxplot.flierprops.markeredgecolor"] = "#0b0f1a"
-    plt.rcParams["boxplot.whiskerprops.linestyle"] = "-"
-
-    plt.rcParams["figure.autolayout"] = False
-    plt.rcParams["figure.constrained_layout.use"] = True
-    plt.rcParams["figure.constrained_layout.h_pad"] = 0.04
-    plt.rcParams["figure.constrained_layout.w_pad"] = 0.04
-
-    plt.rcParams["mathtext.default"] = "regular"
-    plt.rcParams["pdf.fonttype"] = 42
-    plt.rcParams["ps.fonttype"] = 42
+_BW_PAPER_COLORS = ("#111111",)
 
 
 def apply_bw_paper_style() -> None:
     """
     Apply monochrome paper style for grayscale/print outputs.
     """
-    import matplotlib.pyplot as plt
-    from cycler import cycler
-
-    plt.rcParams["font.family"] = "serif"
-    plt.rcParams["font.serif"] = [
-        "Times New Roman",
-        "Georgia",
-        "DejaVu Serif",
-        "Liberation Serif",
-    ]
-    plt.rcParams["font.size"] = 11
-    plt.rcParams["text.color"] = "#000000"
-    plt.rcParams["axes.labelcolor"] = "#000000"
-    plt.rcParams["axes.labelweight"] = "normal"
-    plt.rcParams["axes.unicode_minus"] = True
-
-    plt.rcParams["axes.titlesize"] = 13
-    plt.rcParams["axes.titleweight"] = "bold"
-    plt.rcParams["axes.titlelocation"] = "center"
-    plt.rcParams["axes.labelsize"] = 12
-    plt.rcParams["xtick.labelsize"] = 10
-    plt.rcParams["ytick.labelsize"] = 10
-    plt.rcParams["legend.fontsize"] = 10
-
-    plt.rcParams["figure.facecolor"] = "#ffffff"
-    plt.rcParams["axes.facecolor"] = "#ffffff"
-    plt.rcParams["savefig.facecolor"] = "#ffffff"
-    plt.rcParams["figure.edgecolor"] = "#ffffff"
-    plt.rcParams["figure.dpi"] = 100
-    plt.rcParams["savefig.dpi"] = 300
-    plt.rcParams["savefig.bbox"] = "tight"
-    plt.rcParams["savefig.pad_inches"] = 0.05
-
-    plt.rcParams["axes.edgecolor"] = "#000000"
-    plt.rcParams["axes.linewidth"] = 0.8
-    plt.rcParams["axes.spines.top"] = True
-    plt.rcParams["axes.spines.right"] = True
-    plt.rcParams["axes.spines.left"] = True
-    plt.rcParams["axes.spines.bottom"] = True
-
-    plt.rcParams["axes.grid"] = True
-    plt.rcParams["grid.color"] = "#cccccc"
-    plt.rcParams["grid.linewidth"] = 0.6
-    plt.rcParams["grid.alpha"] = 0.8
-    plt.rcParams["grid.linestyle"] = "--"
-
-    plt.rcParams["xtick.color"] = "#000000"
-    plt.rcParams["ytick.color"] = "#000000"
-    plt.rcParams["xtick.direction"] = "out"
-    plt.rcParams["ytick.direction"] = "out"
-    plt.rcParams["xtick.minor.visible"] = True
-    plt.rcParams["ytick.minor.visible"] = True
-    plt.rcParams["xtick.major.size"] = 4
-    plt.rcParams["ytick.major.size"] = 4
-    plt.rcParams["xtick.major.width"] = 0.8
-    plt.rcParams["ytick.major.width"] = 0.8
-    plt.rcParams["xtick.minor.size"] = 2
-    plt.rcParams["ytick.minor.size"] = 2
-    plt.rcParams["xtick.minor.width"] = 0.6
-    plt.rcParams["ytick.minor.width"] = 0.6
-
-    plt.rcParams["lines.linewidth"] = 1.4
-    plt.rcParams["lines.solid_capstyle"] = "butt"
-    plt.rcParams["lines.solid_joinstyle"] = "miter"
-    plt.rcParams["lines.antialiased"] = True
-    plt.rcParams["lines.markersize"] = 4
-    plt.rcParams["lines.markeredgewidth"] = 0.6
-    plt.rcParams["errorbar.capsize"] = 2
-
-    plt.rcParams["patch.edgecolor"] = "#000000"
-    plt.rcParams["patch.force_edgecolor"] = True
-
-    plt.rcParams["image.cmap"] = "Greys"
-    plt.rcParams["image.interpolation"] = "nearest"
-
-    plt.rcParams["axes.prop_cycle"] = cycler(color=["#111111"])
-
-    plt.rcParams["legend.frameon"] = True
-    plt.rcParams["legend.facecolor"] = "#ffffff"
-    plt.rcParams["legend.edgecolor"] = "#000000"
-    plt.rcParams["legend.fancybox"] = False
-    plt.rcParams["legend.framealpha"] = 1.0
-    plt.rcParams["legend.title_fontsize"] = 10
-    plt.rcParams["legend.handlelength"] = 1.6
-    plt.rcParams["legend.handletextpad"] = 0.4
-    plt.rcParams["legend.borderaxespad"] = 0.4
-
-    plt.rcParams["boxplot.flierprops.marker"] = "o"
-    plt.rcParams["boxplot.flierprops.markerfacecolor"] = "#888888"
-    plt.rcParams["boxplot.flierprops.markeredgecolor"] = "#000000"
-    plt.rcParams["boxplot.whiskerprops.linestyle"] = "-"
-
-    plt.rcParams["figure.autolayout"] = False
-    plt.rcParams["figure.constrained_layout.use"] = True
-    plt.rcParams["figure.constrained_layout.h_pad"] = 0.02
-    plt.rcParams["figure.constrained_layout.w_pad"] = 0.02
-
-    plt.rcParams["mathtext.default"] = "regular"
-    plt.rcParams["pdf.fonttype"] = 42
-    plt.rcParams["ps.fonttype"] = 42
+    _apply_preset(_BW_PAPER_RC, _BW_PAPER_COLORS)
+
+
+_NOTHING_RC = MappingProxyType(
+    {
+        "figure.facecolor": "none",
+        "axes.facecolor": "none",
+        "savefig.facecolor": "none",
+        "figure.edgecolor": "none",
+        "savefig.transparent": True,
+
+        "axes.spines.top": False,
+        "axes.spines.right": False,
+        "axes.spines.left": False,
+        "axes.spines.bottom": False,
+
+        "xtick.bottom": False,
+        "xtick.labelbottom": False,
+        "ytick.left": False,
+        "ytick.labelleft": False,
+
+        "axes.titlesize": 12,
+        "axes.labelsize": 12,
+        "xtick.labelsize": 10,
+        "ytick.labelsize": 10,
+
+        "axes.grid": False,
+        "figure.autolayout": False,
+        "figure.constrained_layout.use": False,
+
+        "image.interpolation": "antialiased",
+        "savefig.bbox": "tight",
+        "savefig.pad_inches": 0.0,
+    }
+)
 
 
 def apply_nothing_style() -> None:
@@ -487,46 +573,45 @@ def apply_nothing_style() -> None:
 
     Intended for clean image export or compositing where only the data should be visible.
     """
-    import matplotlib.pyplot as plt
+    _apply_preset(_NOTHING_RC)
 
-    plt.rcParams["figure.facecolor"] = "none"
-    plt.rcParams["axes.facecolor"] = "none"
-    plt.rcParams["savefig.facecolor"] = "none"
-    plt.rcParams["figure.edgecolor"] = "none"
-    plt.rcParams["savefig.transparent"] = True
 
-    plt.rcParams["axes.spines.top"] = False
-    plt.rcParams["axes.spines.right"] = False
-    plt.rcParams["axes.spines.left"] = False
-    plt.rcParams["axes.spines.bottom"] = False
+# Preset name -> (rcParams table, color cycle or None).
+_PRESETS = {
+    "dark_pres_mono": (_DARK_PRES_MONO_RC, _DARK_PRES_MONO_COLORS),
+    "color_pres": (_COLOR_PRES_RC, _COLOR_PRES_COLORS),
+    "paper": (_PAPER_RC, _PAPER_COLORS),
+    "bw_paper": (_BW_PAPER_RC, _BW_PAPER_COLORS),
+    "nothing": (_NOTHING_RC, None),
+}
 
-    plt.rcParams["xtick.bottom"] = False
-    plt.rcParams["xtick.labelbottom"] = False
-    plt.rcParams["ytick.left"] = False
-    plt.rcParams["ytick.labelleft"] = False
+_PRESET_RCS = tuple(rc for rc, _ in _PRESETS.values())
 
-    plt.rcParams["axes.titlesize"] = 12
-    plt.rcParams["axes.labelsize"] = 12
-    plt.rcParams["xtick.labelsize"] = 10
-    plt.rcParams["ytick.labelsize"] = 10
+_CUSTOM_STYLES = {
+    "dark_pres_mono": apply_dark_pres_mono_style,
+    "color_pres": apply_color_pres_style,
+    "paper": apply_paper_style,
+    "bw_paper": apply_bw_paper_style,
+    "nothing": apply_nothing_style,
+}
 
-    plt.rcParams["axes.grid"] = False
-    plt.rcParams["figure.autolayout"] = False
-    plt.rcParams["figure.constrained_layout.use"] = False
 
-    plt.rcParams["image.interpolation"] = "antialiased"
-    plt.rcParams["savefig.bbox"] = "tight"
-    plt.rcParams["savefig.pad_inches"] = 0.0
+@lru_cache(maxsize=1)
+def _style_dispatch() -> dict[str, tuple[str, object]]:
+    """Return lowercase name -> ("custom", apply function) or ("builtin", name) (cached).
 
-
-def _builtin_style_lookup() -> dict[str, str]:
-    """Return a lowercase lookup for matplotlib's available styles."""
+    Custom presets take precedence over matplotlib styles of the same name.
+    """
     import matplotlib.pyplot as plt
 
-    return {name.lower(): name for name in plt.style.available}
+    table: dict[str, tuple[str, object]] = {
+        name.lower(): ("builtin", name) for name in plt.style.available
+    }
+    table.update((name, ("custom", apply)) for name, apply in _CUSTOM_STYLES.items())
+    return table
 
 
-def set_style(style: str) -> None:
+def set_style(style: str, *, layout: "str | None" = None) -> None:
     """
     Apply a named matplotlib style preset.
 
@@ -538,32 +623,100 @@ def set_style(style: str) -> None:
         the name matches a matplotlib native style (e.g. ``\"seaborn\"``,
         ``\"ggplot\"``, ``\"classic\"``), that style is applied via
         ``plt.style.use``.
+    layout:
+        Optional figure layout overriding the style's choice: ``"constrained"``,
+        ``"tight"`` (``figure.autolayout``) or ``"none"``. Scripts that lay out
+        figures themselves can skip the constrained-layout engine this way.
+
+    Re-applying the current style is skipped while rcParams still hold the
+    values it set; any change made in between makes it apply again.
     """
     import matplotlib.pyplot as plt
 
+    if layout is not None and layout not in _LAYOUT_RC:
+        options = ", ".join(sorted(_LAYOUT_RC))
+        raise ValueError(f"Unknown layout '{layout}'. Available: {options}")
     normalized = style.strip().lower()
-    styles = {
-        "dark_pres_mono": apply_dark_pres_mono_style,
-        "color_pres": apply_color_pres_style,
-        "paper": apply_paper_style,
-        "bw_paper": apply_bw_paper_style,
-        "nothing": apply_nothing_style,
-    }
 
-    global _CURRENT_STYLE
-    if normalized in styles:
-        styles[normalized]()
-        _CURRENT_STYLE = normalized
+    dispatch = _style_dispatch()
+    if normalized not in dispatch:
+        # The style library may have been reloaded since the table was cached.
+        _style_dispatch.cache_clear()
+        dispatch = _style_dispatch()
+    if normalized not in dispatch:
+        available = ", ".join(sorted(dispatch))
+        raise ValueError(f"Unknown style '{style}'. Available styles: {available}")
+
+    kind, target = dispatch[normalized]
+    name = normalized if kind == "custom" else target
+    if _style_still_applied(name, layout):
         return
+    if kind == "custom":
+        target()
+        keys = _preset_defaults()
+    else:
+        plt.style.use(target)
+        keys = plt.style.library[target]
+    if layout is not None:
+        plt.rcParams.update(_LAYOUT_RC[layout])
+    _remember_style(name, layout, set(keys).union(_LAYOUT_RC["none"]))
+
+
+def _remember_style(name: str, layout: "str | None", keys) -> None:
+    """Record ``name`` as current, with the values it left for ``keys``."""
+    import matplotlib.pyplot as plt
 
-    builtin_styles = _builtin_style_lookup()
-    if normalized in builtin_styles:
-        plt.style.use(builtin_styles[normalized])
-        _CURRENT_STYLE = builtin_styles[normalized]
-        return
+    global _CURRENT_STYLE, _APPLIED_LAYOUT, _APPLIED_RC
+    rc = plt.rcParams
+    # Lists are copied so in-place edits of rcParams entries are noticed too.
+    _APPLIED_RC = {key: list(rc[key]) if isinstance(rc[key], list) else rc[key] for key in keys}
+    _APPLIED_LAYOUT = layout
+    _CURRENT_STYLE = name
+
+
+def _style_still_applied(name: str, layout: "str | None") -> bool:
+    """True when ``name`` with ``layout`` was applied last and rcParams still hold its values."""
+    if name != _CURRENT_STYLE or layout != _APPLIED_LAYOUT or _APPLIED_RC is None:
+        return False
+    import matplotlib.pyplot as plt
+
+    rc = plt.rcParams
+    return all(rc[key] == value for key, value in _APPLIED_RC.items())
 
-    available = ", ".join(sorted(set(styles) | set(builtin_styles)))
-    raise ValueError(f"Unknown style '{style}'. Available styles: {available}")
+
+@lru_cache(maxsize=None)
+def _preset_mapping(name: str) -> Mapping[str, object]:
+    """Read-only rcParams of preset ``name``, color cycle included (cached)."""
+    rc, colors = _PRESETS[name]
+    if colors is None:
+        return rc
+    from cycler import cycler
+
+    return MappingProxyType({**rc, "axes.prop_cycle": cycler(color=colors)})
+
+
+def get_style_dict(style: str) -> Mapping[str, object]:
+    """
+    Return the rcParams set by a custom style preset.
+
+    Parameters
+    ----------
+    style:
+        Name of a custom preset (``"dark_pres_mono"``, ``"color_pres"``,
+        ``"paper"``, ``"bw_paper"`` or ``"nothing"``, case-insensitive).
+
+    Returns
+    -------
+    Mapping
+        Read-only mapping of the preset's rcParams, suitable for
+        ``plt.rcParams.update`` or ``plt.style.use``. It holds only the keys the
+        preset sets; ``set_style`` additionally resets keys set by other presets.
+    """
+    normalized = style.strip().lower()
+    if normalized not in _PRESETS:
+        available = ", ".join(sorted(_PRESETS))
+        raise ValueError(f"Unknown style preset '{style}'. Available presets: {available}")
+    return _preset_mapping(normalized)
 
 
 def get_style() -> str | None:
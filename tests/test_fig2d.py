@@ -53,6 +53,36 @@ def test_quickmap_stacks_multiple_maps_on_same_axis():
     assert fig.axes[1].get_ylabel() == "one"
 
 
+def test_quickmap_bypasses_pyplot_only_when_not_interactive():
+    import matplotlib.pyplot as plt
+
+    mapper = MapObject(_grid_with_values([[0, 1], [2, 3]]))
+
+    fig, _ = quickmap(mapper)
+    assert fig.number in plt.get_fignums()
+    plt.close(fig)
+
+    before = plt.get_fignums()
+    fig, _ = quickmap(mapper, interactive=False)
+    assert plt.get_fignums() == before
+    assert fig.canvas.get_renderer() is not None
+
+
+def test_quickmap_rgba_precolours_layers():
+    grid = _grid_with_values([[0, 1], [np.nan, 3]])
+    mapper = MapObject(grid, cmap="gray", alpha=0.5, cbar="elev")
+
+    fig, ax = quickmap(mapper, rgba=True)
+
+    data = ax.images[0].get_array()
+    assert data.dtype == np.uint8
+    assert data.shape == (2, 2, 4)
+    assert data[1, 0, 3] == 0  # NaN stays transparent
+    assert data[0, 0, 3] == 127
+    assert tuple(data[1, 1, :3]) == (255, 255, 255)
+    assert fig.axes[1].get_ylabel() == "elev"
+
+
 def test_quickmap_labels_ticks_and_crosses():
     grid = _grid_with_values([[0, 1], [2, 3]])
     mapper = MapObject(grid, cbar="elev")
@@ -80,6 +110,29 @@ def test_fig2d_object_adds_and_tracks_maps():
     assert mapper in fig_obj.images
     assert mapper in fig_obj.colorbars
     assert fig_obj.colorbars[mapper].ax.get_ylabel() == "cb"
+    assert fig_obj.image_for(mapper) is fig_obj.images[mapper]
+
+    with pytest.raises(TypeError):
+        fig_obj.images[mapper] = None
+    with pytest.raises(TypeError):
+        del fig_obj.colorbars[mapper]
+
+
+def test_fig2d_object_update_layer_with_blitting(tmp_path):
+    grid = _grid_with_values([[1, 2], [3, 4]])
+    mapper = MapObject(grid, cbar="cb")
+
+    fig_obj = Fig2DObject(figsize=(2, 2))
+    fig_obj.add_maps(fig_obj.ax, mapper)
+    fig_obj.enable_blit()
+
+    new_value = np.array([[4, 3], [2, 1]], dtype=np.float32)
+    im = fig_obj.update_layer(mapper, new_value)
+
+    assert im is fig_obj.image_for(mapper)
+    np.testing.assert_array_equal(im.get_array(), new_value)
+    fig_obj.save(fname=tmp_path / "blit.png")
+    assert im.get_animated()
 
 
 def test_fig2d_object_ax_property_only_single_axis():
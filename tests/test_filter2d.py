@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from scipy.ndimage import gaussian_filter
+
+from topotoolbox import GridObject
+
+from pytopoviz import MapObject
+from pytopoviz.filter2d import FFT_SIGMA_THRESHOLD, NAN_KERNEL_SIGMA_LIMIT, gaussian_smooth
+
+
+@pytest.mark.parametrize("mode", ["nearest", "reflect", "constant"])
+@pytest.mark.parametrize("sigma", [1.5, FFT_SIGMA_THRESHOLD + 2.0])
+def test_gaussian_smooth_matches_scipy(mode, sigma):
+    rng = np.random.default_rng(1)
+    grid = GridObject()
+    grid.z = (rng.random((40, 35)) * 100).astype(np.float32)
+    mapper = MapObject(grid)
+
+    gaussian_smooth(sigma=sigma, mode=mode)(mapper)
+
+    values = grid.z.astype(np.float64)
+    weights = gaussian_filter(np.ones_like(values), sigma=sigma, mode=mode)
+    expected = gaussian_filter(values, sigma=sigma, mode=mode) / weights
+    np.testing.assert_allclose(mapper.value, expected, rtol=1e-5, atol=1e-4)
+
+
+@pytest.mark.parametrize("mode", ["nearest", "mirror", "wrap", "constant"])
+@pytest.mark.parametrize("sigma", [1.0, NAN_KERNEL_SIGMA_LIMIT + 1.0])
+def test_gaussian_smooth_renormalizes_around_nans(mode, sigma):
+    rng = np.random.default_rng(2)
+    values = (rng.random((30, 25)) * 100).astype(np.float32)
+    values[rng.random(values.shape) < 0.1] = np.nan
+    values[5:15, 3:12] = np.nan
+    grid = GridObject()
+    grid.z = values
+    mapper = MapObject(grid)
+
+    gaussian_smooth(sigma=sigma, mode=mode)(mapper)
+
+    finite = np.isfinite(values)
+    weights = gaussian_filter(finite.astype(np.float64), sigma=sigma, mode=mode)
+    smoothed = gaussian_filter(np.where(finite, values, 0.0).astype(np.float64), sigma=sigma, mode=mode)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        expected = smoothed / weights
+    expected[weights == 0.0] = np.nan
+    np.testing.assert_allclose(mapper.value, expected, rtol=1e-5, atol=1e-4)
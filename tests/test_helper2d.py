@@ -33,6 +33,8 @@ def test_add_grid_crosses_adds_markers_at_ticks():
 
     add_grid_crosses(ax, color="red", size=5)
 
-    # One Line2D per cross
+    # All major crosses share a single Line2D
     lines = [line for line in ax.lines if line.get_marker() == "+"]
-    assert len(lines) == 9
+    assert len(lines) == 1
+    points = set(zip(lines[0].get_xdata(), lines[0].get_ydata()))
+    assert points == {(x, y) for x in (0.0, 0.5, 1.0) for y in (0.0, 0.5, 1.0)}
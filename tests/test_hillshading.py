@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 import warnings
 
 from topotoolbox import GridObject
@@ -36,6 +37,20 @@ def test_multishade_averages_two_directions():
     np.testing.assert_allclose(combined.value, expected, rtol=5e-5, atol=5e-5)
 
 
+def test_multishade_averages_any_number_of_directions():
+    rng = np.random.default_rng(3)
+    grid = _build_grid((rng.random((12, 9)) * 10).astype(np.float32))
+    mapper = MapObject(grid)
+    azimuths = (0.0, 90.0, 180.0, 270.0)
+
+    combined = multishade(mapper, azimuths=azimuths)
+
+    expected = np.mean([hillshade(mapper, azimuth=az).value for az in azimuths], axis=0)
+    np.testing.assert_allclose(combined.value, expected, rtol=5e-5, atol=5e-5)
+    with pytest.raises(ValueError):
+        multishade(mapper, azimuths=())
+
+
 def test_hillshade_uses_mapper_value_data():
     base = np.array([[0.0, 1.0, 2.0], [0.0, 1.0, 2.0], [0.0, 1.0, 2.0]], dtype=np.float32)
     grid = _build_grid(base)
@@ -121,3 +136,36 @@ def test_smooth_multishade_averages_two_smoothed_directions():
 
     expected = np.nanmean(np.stack([shade_single.value, shade_single_alt.value]), axis=0)
     np.testing.assert_allclose(combined.value, expected, rtol=5e-5, atol=5e-5)
+
+
+def test_hillshade_matches_topotoolbox_on_georeferenced_grid():
+    from affine import Affine
+
+    rng = np.random.default_rng(0)
+    grid = _build_grid((rng.random((12, 15)) * 100).astype(np.float32))
+    grid.cellsize = 30.0
+    grid.transform = Affine(30.0, 0.0, 1000.0, 0.0, -30.0, 5000.0)
+    mapper = MapObject(grid)
+
+    expected = grid.hillshade(azimuth=135.0, altitude=50.0, exaggerate=2.0, fused=True)
+    shaded = hillshade(mapper, azimuth=135.0, altitude=50.0, exaggerate=2.0)
+
+    np.testing.assert_allclose(shaded.value, expected.z, rtol=5e-5, atol=5e-5)
+
+
+def test_horn_gradient_matches_central_on_planar_surface():
+    rows, cols = np.mgrid[0:6, 0:7]
+    grid = _build_grid((0.5 * cols - 0.25 * rows).astype(np.float32))
+    mapper = MapObject(grid)
+
+    central = hillshade(mapper, azimuth=315.0, gradient="central")
+    horn = hillshade(mapper, azimuth=315.0, gradient="horn")
+
+    np.testing.assert_allclose(horn.value, central.value, rtol=1e-5, atol=1e-6)
+
+
+def test_hillshade_rejects_unknown_gradient():
+    mapper = MapObject(_build_grid(np.zeros((3, 3), dtype=np.float32)))
+
+    with pytest.raises(ValueError):
+        hillshade(mapper, gradient="sobel")
@@ -1,2 +1,23 @@
+import subprocess
+import sys
+
+import pytest
+
+
 def test_import_package():
     import pytopoviz  # noqa: F401
+
+
+@pytest.mark.parametrize("module", ["filter2d", "masknan", "shading2d", "helper3d"])
+def test_processor_module_imports_first(module):
+    # Fresh interpreter: the processor module must be importable before processing.
+    code = f"import pytopoviz.{module}; import pytopoviz; pytopoviz.processor.nan_below"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_fig3d_import_defers_pyvista():
+    code = (
+        "import sys; import pytopoviz.fig3d; "
+        "assert 'pyvista' not in sys.modules, 'pyvista imported eagerly'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
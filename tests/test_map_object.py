@@ -1,9 +1,11 @@
 import numpy as np
+import pytest
 
 from topotoolbox import GridObject
 
-from pytopoviz import MapObject, expand_plottables
-from pytopoviz.masknan import nan_above, nan_below
+from pytopoviz import MapObject, ProcessorFactory, expand_plottables, expand_plottables_many
+from pytopoviz.helper3d import double_scale, halve_scale, tenfold
+from pytopoviz.masknan import nan_above, nan_below, nan_equal, nan_filter
 
 
 def test_map_object_defaults_and_nan_handling():
@@ -22,6 +24,31 @@ def test_map_object_defaults_and_nan_handling():
     assert np.isnan(mapper.value[1, 0])
 
 
+def test_map_object_value_is_c_contiguous_copy():
+    grid = GridObject()
+    grid.z = np.asfortranarray(np.arange(6, dtype=np.float64).reshape(2, 3))
+
+    mapper = MapObject(grid)
+
+    assert mapper.value.flags["C_CONTIGUOUS"]
+    assert not np.shares_memory(mapper.value, grid.z)
+    np.testing.assert_array_equal(mapper.value, grid.z)
+
+
+def test_map_object_copy_false_adopts_float32_grid():
+    grid = GridObject()
+    grid.z = np.array([[1.0, np.inf], [2.0, 3.0]], dtype=np.float32)
+
+    mapper = MapObject(grid, copy=False)
+
+    assert mapper.value is grid.z
+    assert np.isnan(grid.z[0, 1])
+    assert (mapper.vmin, mapper.vmax) == (1.0, 3.0)
+
+    grid.z = grid.z.astype(np.float64)
+    assert not np.shares_memory(MapObject(grid, copy=False).value, grid.z)
+
+
 def test_set_nan_filters_via_processor():
     grid = GridObject()
     grid.z = np.array([[0.0, 5.0], [10.0, 15.0]])
@@ -39,6 +66,58 @@ def test_set_nan_filters_via_processor():
     assert processed.value[1, 0] == np.float32(10.0)
 
 
+def test_nan_filter_matches_chained_filters():
+    grid = GridObject()
+    grid.z = np.arange(12.0).reshape(3, 4)
+
+    chained = MapObject(grid)
+    chained.processors.extend([nan_equal(5.0), nan_below(1.0), nan_above(10.0)])
+    fused = MapObject(grid)
+    fused.processors.append(nan_filter(equal=5.0, below=1.0, above=10.0))
+
+    expected = expand_plottables(chained)[0].value
+    np.testing.assert_array_equal(expand_plottables(fused)[0].value, expected)
+    assert np.isnan(expected).sum() == 5
+
+    only_above = MapObject(grid)
+    only_above.processors.append(nan_filter(above=11.0))
+    assert np.isnan(expand_plottables(only_above)[0].value).sum() == 1
+
+
+def test_adjacent_nan_filters_are_fused_and_stay_editable():
+    grid = GridObject()
+    grid.z = np.arange(12.0).reshape(3, 4)
+
+    mapper = MapObject(grid)
+    below = nan_below(1.0)
+    mapper.processors.extend([nan_equal(5.0), below, nan_above(10.0), nan_equal(7.0)])
+    expand_plottables(mapper)
+
+    below.threshold = 3.0  # adjust after the chain was fused
+    mapper.value = grid.z
+    processed = expand_plottables(mapper)[0].value
+
+    assert np.isnan(processed).sum() == 8
+    assert processed[1, 0] == np.float32(4.0)
+
+
+def test_custom_processor_named_nan_below_is_not_fused():
+    grid = GridObject()
+    grid.z = np.arange(12.0).reshape(3, 4)
+
+    def process(self, mapper):
+        mapper.value[mapper.value >= self.threshold] = np.nan
+        return None
+
+    custom = ProcessorFactory.build("nan_below", process, threshold=10.0)
+    mapper = MapObject(grid)
+    mapper.processors.extend([nan_below(1.0), custom])
+
+    processed = expand_plottables(mapper)[0].value
+    assert np.isnan(processed).sum() == 4
+    assert processed[2, 1] == np.float32(9.0)
+
+
 def test_processor_params_are_editable():
     grid = GridObject()
     grid.z = np.array([[1.0, 2.0]])
@@ -52,6 +131,88 @@ def test_processor_params_are_editable():
     assert np.isnan(processed.value[0, 1])
 
 
+def test_expand_plottables_sees_processors_added_later():
+    grid = GridObject()
+    grid.z = np.array([[1.0, 2.0, 3.0]])
+
+    mapper = MapObject(grid)
+    mapper.processors.append(nan_above(2.5))
+    expand_plottables(mapper, mode="2d")
+    mapper.processors.append(nan_below(1.5))
+
+    processed = expand_plottables(mapper, mode="2d")[0]
+    assert np.isnan(processed.value[0, 0])
+    assert processed.value[0, 1] == np.float32(2.0)
+    assert np.isnan(processed.value[0, 2])
+
+
+def test_compatibility_flags_are_editable():
+    grid = GridObject()
+    grid.z = np.array([[1.0, 2.0, 3.0]])
+
+    mapper = MapObject(grid)
+    proc = nan_above(2.5)
+    proc.compatible_2d = False
+    mapper.processors.append(proc)
+
+    assert getattr(proc, "2d_compatible") is False
+    assert expand_plottables(mapper, mode="2d")[0].value[0, 2] == np.float32(3.0)
+
+    setattr(proc, "2d_compatible", True)
+    assert proc.compatible_2d is True
+    assert np.isnan(expand_plottables(mapper, mode="2d")[0].value[0, 2])
+
+
+def test_chained_scale_processors_multiply():
+    grid = GridObject()
+    grid.z = np.array([[1.0, 2.0]])
+
+    mapper = MapObject(grid)
+    halve = halve_scale()
+    mapper.processors.extend([tenfold(), halve, double_scale()])
+    halve.factor = 0.25  # adjust after creation
+
+    expand_plottables(mapper, mode="3d")
+    assert mapper.z_scale_factor == 5.0
+
+
+def test_custom_processor_named_scale_is_not_fused():
+    grid = GridObject()
+    grid.z = np.array([[1.0, 2.0]])
+
+    calls = []
+
+    def process(self, mapper):
+        calls.append(self)
+        mapper.z_scale_factor = mapper.z_scale_factor + 1.0
+        return None
+
+    custom = ProcessorFactory.build("scale", process, compatible_2d=False)
+    mapper = MapObject(grid)
+    mapper.processors.extend([double_scale(), custom, double_scale()])
+
+    expand_plottables(mapper, mode="3d")
+    assert calls == [custom]
+    assert mapper.z_scale_factor == 6.0
+
+
+def test_expand_plottables_many_keeps_input_order():
+    mappers = []
+    for offset in range(4):
+        grid = GridObject()
+        grid.z = np.array([[offset, offset + 1.0]])
+        mapper = MapObject(grid)
+        mapper.processors.append(nan_above(offset + 0.5))
+        mappers.append(mapper)
+
+    expanded = expand_plottables_many(mappers)
+
+    assert [layers[0] for layers in expanded] == mappers
+    for offset, layers in enumerate(expanded):
+        assert layers[0].value[0, 0] == np.float32(offset)
+        assert np.isnan(layers[0].value[0, 1])
+
+
 def test_getters_setters_refresh_values():
     grid = GridObject()
     grid.z = np.array([[1.0, 2.0], [3.0, 4.0]])
@@ -76,6 +237,7 @@ def test_getters_setters_refresh_values():
     mapper.grid = new_grid
 
     assert mapper.grid is new_grid
+    assert mapper.extent == new_grid.extent
     assert mapper.vmin == 5.0
     assert mapper.vmax == 6.0
 
@@ -90,3 +252,14 @@ def test_map_object_name_and_hashability():
 
     store = {mapper: "stored"}
     assert store[mapper] == "stored"
+
+
+def test_map_object_uses_slots():
+    grid = GridObject()
+    grid.z = np.array([[1.0, 2.0]])
+
+    mapper = MapObject(grid)
+    assert not hasattr(mapper, "__dict__")
+    expand_plottables(mapper, mode="2d")
+    with pytest.raises(AttributeError):
+        mapper.not_an_attribute = 1
@@ -0,0 +1,83 @@
+import matplotlib
+
+# non-interactive backend for tests
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pytest
+
+from pytopoviz import get_style, get_style_dict, set_style
+
+
+def test_switching_presets_does_not_leak_rcparams():
+    plt.rcdefaults()
+    try:
+        set_style("dark_pres_mono")
+        assert plt.rcParams["xtick.minor.visible"] is True
+
+        set_style("nothing")
+        assert get_style() == "nothing"
+        assert plt.rcParams["savefig.transparent"] is True
+        # Only set by dark_pres_mono: back to the matplotlib default.
+        assert plt.rcParams["xtick.minor.visible"] == matplotlib.rcParamsDefault["xtick.minor.visible"]
+        assert plt.rcParams["font.family"] == matplotlib.rcParamsDefault["font.family"]
+        assert plt.rcParams["axes.prop_cycle"] == matplotlib.rcParamsDefault["axes.prop_cycle"]
+    finally:
+        plt.rcdefaults()
+
+
+def test_get_style_dict_is_read_only_and_applicable():
+    rc = get_style_dict("Paper")
+
+    with pytest.raises(TypeError):
+        rc["font.size"] = 99
+    with pytest.raises(ValueError):
+        get_style_dict("not_a_preset")
+
+    plt.rcdefaults()
+    try:
+        plt.style.use(rc)
+        assert plt.rcParams["font.size"] == rc["font.size"]
+        assert plt.rcParams["axes.prop_cycle"] == rc["axes.prop_cycle"]
+    finally:
+        plt.rcdefaults()
+
+
+def test_set_style_skips_only_unchanged_reapplication(monkeypatch):
+    from pytopoviz import style2d
+
+    calls = []
+    apply_preset = style2d._apply_preset
+    monkeypatch.setattr(
+        style2d, "_apply_preset", lambda *args: (calls.append(1), apply_preset(*args))
+    )
+
+    plt.rcdefaults()
+    try:
+        set_style("paper")
+        set_style("paper")
+        assert len(calls) == 1
+
+        plt.rcParams["font.size"] = 30
+        set_style("paper")
+        assert len(calls) == 2
+        assert plt.rcParams["font.size"] == get_style_dict("paper")["font.size"]
+    finally:
+        plt.rcdefaults()
+
+
+def test_set_style_layout_override():
+    plt.rcdefaults()
+    try:
+        set_style("paper", layout="tight")
+        assert plt.rcParams["figure.autolayout"] is True
+        assert plt.rcParams["figure.constrained_layout.use"] is False
+
+        set_style("paper")
+        assert plt.rcParams["figure.autolayout"] is False
+        assert plt.rcParams["figure.constrained_layout.use"] is True
+
+        with pytest.raises(ValueError):
+            set_style("paper", layout="grid")
+    finally:
+        plt.rcdefaults()